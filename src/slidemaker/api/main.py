@@ -23,6 +23,9 @@ Environment Variables:
     AWS_REGION: AWS region (オプション、デフォルト: us-east-1)
     ALLOWED_ORIGINS: CORS allowed origins (オプション、デフォルト: *)
     LOG_LEVEL: ログレベル (オプション、デフォルト: INFO)
+    MAX_CONCURRENT_WORKFLOWS: ワークフローの同時実行数 (オプション、デフォルト: 2)
+    SM_THREADPOOL: ブロッキング処理用スレッド数
+        (オプション、デフォルトかつ最小値: MAX_CONCURRENT_WORKFLOWS + 1)
 
 Example:
     # Development server
@@ -33,18 +36,26 @@ Example:
     handler = Mangum(app)
 """
 
+import asyncio
 import base64
+import functools
 import os
+import re
+import shutil
+import tempfile
 import traceback
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from slidemaker.api.schemas.enums import HealthStatus, TaskStatus
 from slidemaker.api.schemas.requests import ConvertSlideRequest, CreateSlideRequest
 from slidemaker.api.schemas.responses import (
     HealthCheckResponse,
@@ -53,91 +64,283 @@ from slidemaker.api.schemas.responses import (
 )
 from slidemaker.api.storage import S3Storage
 from slidemaker.api.tasks import TaskManager
-from slidemaker.core.models.slide_config import SlideConfig
-from slidemaker.image_processing.analyzer import ImageAnalyzer
-from slidemaker.image_processing.loader import ImageLoader
-from slidemaker.image_processing.processor import ImageProcessor
-from slidemaker.llm.manager import LLMManager
-from slidemaker.llm.models import LLMConfig
-from slidemaker.pptx.generator import PowerPointGenerator
+from slidemaker.utils.config_loader import LLMConfig
 from slidemaker.utils.file_manager import FileManager
 from slidemaker.utils.logger import get_logger, setup_logger
-from slidemaker.workflows.conversion import ConversionWorkflow
-from slidemaker.workflows.new_slide import NewSlideWorkflow
+
+if TYPE_CHECKING:
+    # ワークフロー関連（PIL, lxml, python-pptx等を推移的に読み込む）は遅延インポート
+    from slidemaker.image_processing.analyzer import ImageAnalyzer
+    from slidemaker.image_processing.loader import ImageLoader
+    from slidemaker.image_processing.processor import ImageProcessor
+    from slidemaker.llm.manager import LLMManager
 
 # ログ設定
 setup_logger(level=os.getenv("LOG_LEVEL", "INFO"), format="json")
 logger = get_logger(__name__)
 
-# グローバル変数（Lambda環境での再利用のため）
-storage: S3Storage | None = None
-task_manager: TaskManager | None = None
-llm_manager: LLMManager | None = None
-file_manager: FileManager | None = None
+# 環境変数のスナップショット（Lambdaの実行環境内では不変のため起動時に一度だけ読む）
+_BUCKET_NAME = os.getenv("S3_BUCKET_NAME")
+_ANTHROPIC_AVAILABLE = os.getenv("ANTHROPIC_API_KEY") is not None
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> Any:
-    """FastAPIライフサイクル管理（起動・終了処理）.
+def _positive_int_env(name: str, default: int) -> int:
+    """正の整数を指定する環境変数を読み込みます.
 
     Args:
-        app: FastAPIアプリケーションインスタンス
+        name: 環境変数名
+        default: 未設定時の値
 
-    Yields:
-        None
+    Returns:
+        環境変数の値（未設定の場合はdefault）
 
     Raises:
-        ValueError: 必須環境変数が設定されていない場合
+        ValueError: 値が正の整数でない場合
     """
-    global storage, task_manager, llm_manager, file_manager
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise ValueError(f"{name} must be a positive integer, got {raw!r}")
+    return value
 
-    logger.info("Starting Slidemaker API", version="0.6.0")
 
-    # 環境変数チェック
-    bucket_name = os.getenv("S3_BUCKET_NAME")
-    if not bucket_name:
+# ========================================
+# シングルトンアクセサ（Lambda環境での再利用のため）
+# ========================================
+#
+# SDKクライアントを保持するマネージャーはモジュールレベルで一度だけ構築し、
+# 同一実行環境のウォーム呼び出しでコネクションプールを再利用します。
+# lifespanで一度呼び出してプライミングし、エンドポイントとバックグラウンド
+# タスクはグローバル変数ではなく必ずアクセサ経由で参照します。
+
+
+@functools.lru_cache(maxsize=1)
+def _get_storage() -> S3Storage:
+    """S3Storageシングルトンを取得します.
+
+    Returns:
+        S3Storageインスタンス（クライアントの接続はlifespanで行います）
+
+    Raises:
+        ValueError: S3_BUCKET_NAMEが設定されていない場合
+    """
+    if not _BUCKET_NAME:
         raise ValueError("S3_BUCKET_NAME environment variable is required")
 
+    region = os.getenv("AWS_REGION", "us-east-1")
+    return S3Storage(bucket_name=_BUCKET_NAME, region=region)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_task_manager() -> TaskManager:
+    """TaskManagerシングルトンを取得します.
+
+    Returns:
+        TaskManagerインスタンス
+
+    Raises:
+        ValueError: S3_BUCKET_NAMEが設定されていない場合
+    """
+    return TaskManager(storage=_get_storage())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llm_manager() -> "LLMManager":
+    """LLMManagerシングルトンを取得します.
+
+    Returns:
+        LLMManagerインスタンス（Anthropicクライアントを内包）
+
+    Raises:
+        ValueError: ANTHROPIC_API_KEYが設定されていない場合
+    """
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
     if not anthropic_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable is required")
 
-    # S3Storage初期化
-    region = os.getenv("AWS_REGION", "us-east-1")
-    storage = S3Storage(bucket_name=bucket_name, region=region)
-    await storage.__aenter__()
-    logger.info("S3Storage initialized", bucket=bucket_name, region=region)
-
-    # TaskManager初期化
-    task_manager = TaskManager(storage=storage)
-    logger.info("TaskManager initialized")
+    from slidemaker.llm.manager import LLMManager
 
-    # LLMManager初期化
     composition_config = LLMConfig(
         type="api",
         provider="claude",
         model=os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022"),
         api_key=anthropic_key,
     )
-    llm_manager = LLMManager(composition_config=composition_config)
+    return LLMManager(composition_config=composition_config)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_file_manager() -> FileManager:
+    """FileManagerシングルトンを取得します（一時ディレクトリ使用）.
+
+    Returns:
+        FileManagerインスタンス
+    """
+    return FileManager(output_base_dir="/tmp/slidemaker_output")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_image_loader() -> "ImageLoader":
+    """ImageLoaderシングルトンを取得します.
+
+    Returns:
+        ImageLoaderインスタンス
+    """
+    from slidemaker.image_processing.loader import ImageLoader
+
+    return ImageLoader(file_manager=_get_file_manager())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_image_analyzer() -> "ImageAnalyzer":
+    """ImageAnalyzerシングルトンを取得します.
+
+    Returns:
+        ImageAnalyzerインスタンス
+
+    Raises:
+        ValueError: ANTHROPIC_API_KEYが設定されていない場合
+    """
+    from slidemaker.image_processing.analyzer import ImageAnalyzer
+
+    return ImageAnalyzer(llm_manager=_get_llm_manager())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_image_processor() -> "ImageProcessor":
+    """ImageProcessorシングルトンを取得します.
+
+    Returns:
+        ImageProcessorインスタンス
+    """
+    from slidemaker.image_processing.processor import ImageProcessor
+
+    return ImageProcessor(file_manager=_get_file_manager())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_workflow_modules() -> None:
+    """ワークフロー実行に必要なモジュールを読み込みます.
+
+    これらのモジュールはPIL・lxml・python-pptx等を推移的に読み込むため、
+    モジュールのトップレベルではインポートせず、コールドスタート時に
+    ``/health``や``/``が応答できるようにしています。lifespanで呼び出して
+    初期化フェーズ中に読み込みを済ませ、以降の呼び出しはキャッシュされます。
+    """
+    import slidemaker.image_processing.analyzer
+    import slidemaker.image_processing.loader
+    import slidemaker.image_processing.processor
+    import slidemaker.pptx.generator
+    import slidemaker.workflows.conversion
+    import slidemaker.workflows.new_slide  # noqa: F401
+
+
+@functools.lru_cache(maxsize=1)
+def _get_workflow_semaphore() -> asyncio.Semaphore:
+    """ワークフローの同時実行数を制限するセマフォを取得します.
+
+    BackgroundTasksはリクエストと同じプロセス・イベントループで実行されるため、
+    CPU負荷の高いワークフロー（画像処理、PowerPoint生成）が同時に多数走ると
+    後続リクエストの応答が遅延します。MAX_CONCURRENT_WORKFLOWS（デフォルト2）で
+    同時実行数を制限し、超過分は空きが出るまで待機させます。
+
+    Returns:
+        asyncio.Semaphoreインスタンス
+
+    Raises:
+        ValueError: MAX_CONCURRENT_WORKFLOWSが正の整数でない場合
+    """
+    return asyncio.Semaphore(_positive_int_env("MAX_CONCURRENT_WORKFLOWS", 2))
+
+
+def _require_task_manager() -> TaskManager:
+    """エンドポイント用にTaskManagerを取得します.
+
+    Returns:
+        TaskManagerインスタンス
+
+    Raises:
+        HTTPException: TaskManagerを初期化できない場合（500）
+    """
+    try:
+        return _get_task_manager()
+    except ValueError as e:
+        raise HTTPException(status_code=500, detail="TaskManager not initialized") from e
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> Any:
+    """FastAPIライフサイクル管理（起動・終了処理）.
+
+    Args:
+        app: FastAPIアプリケーションインスタンス
+
+    Yields:
+        None
+
+    Raises:
+        ValueError: 必須環境変数が設定されていない場合、
+            またはスレッド数・同時実行数の環境変数が正の整数でない場合
+    """
+    logger.info("Starting Slidemaker API", version="0.6.0")
+
+    # asyncio.to_threadで使うデフォルトExecutorのスレッド数を制限する。
+    # 既定値（min(32, CPU数+4)）ではPowerPoint生成や画像処理がvCPU数を大きく超えて
+    # 並行し、GIL競合で遅くなるため、小さいLambdaに合わせて絞る。
+    # ただしloop.getaddrinfo（S3/AnthropicのDNS解決）や一時ファイル削除などの
+    # 短い処理も同じExecutorを使うため、全ワークフローがスレッドを占有しても
+    # 1スレッドは空くよう、同時実行数+1を下限とする。
+    min_workers = _positive_int_env("MAX_CONCURRENT_WORKFLOWS", 2) + 1
+    max_workers = max(_positive_int_env("SM_THREADPOOL", min_workers), min_workers)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sm-io")
+    )
+    logger.info("Default executor configured", max_workers=max_workers)
+
+    # ワークフロー関連モジュールを初期化フェーズ中に読み込む
+    _load_workflow_modules()
+    logger.info("Workflow modules loaded")
+
+    # シングルトンのプライミング（環境変数チェックを含む）
+    storage = _get_storage()
+    await storage.__aenter__()
+    logger.info("S3Storage initialized", bucket=storage.bucket_name, region=storage.region)
+
+    _get_task_manager()
+    logger.info("TaskManager initialized")
+
+    _get_llm_manager()
     logger.info("LLMManager initialized")
 
-    # FileManager初期化（一時ディレクトリ使用）
-    file_manager = FileManager(output_base_dir="/tmp/slidemaker_output")
+    _get_file_manager()
     logger.info("FileManager initialized")
 
+    # 変換ワークフロー用のステートレスなコンポーネント
+    # （PowerPointGeneratorはPresentationを保持するためリクエストごとに生成）
+    _get_image_loader()
+    _get_image_analyzer()
+    _get_image_processor()
+    logger.info("Image processing components initialized")
+
     logger.info("Slidemaker API startup completed")
 
     yield
 
     # シャットダウン処理
     logger.info("Shutting down Slidemaker API")
-    if storage:
-        await storage.__aexit__(None, None, None)
-        logger.info("S3Storage closed")
+    await storage.__aexit__(None, None, None)
+    logger.info("S3Storage closed")
 
 
 # FastAPIアプリケーション初期化
+# 各エンドポイントはresponse_modelを宣言しているため、FastAPI 0.130以降では
+# jsonable_encoder + json.dumpsを経由せず、pydantic-coreが直接JSONバイト列へ
+# シリアライズします（ORJSONResponseは非推奨のため使用しません）。
 app = FastAPI(
     title="Slidemaker API",
     description="AI-Powered PowerPoint Generator API",
@@ -191,23 +394,20 @@ async def health_check() -> HealthCheckResponse:
     checks: dict[str, bool] = {}
 
     # LLM接続チェック
-    checks["llm_available"] = os.getenv("ANTHROPIC_API_KEY") is not None
+    checks["llm_available"] = _ANTHROPIC_AVAILABLE
 
     # S3接続チェック
-    checks["storage_available"] = (
-        os.getenv("S3_BUCKET_NAME") is not None and storage is not None
-    )
+    checks["storage_available"] = bool(_BUCKET_NAME) and _get_storage().is_connected
 
     # 全体ステータス
-    status: Literal["ok", "degraded", "down"]
     if all(checks.values()):
-        status = "ok"
+        status = HealthStatus.OK
     elif any(checks.values()):
-        status = "degraded"
+        status = HealthStatus.DEGRADED
     else:
-        status = "down"
+        status = HealthStatus.DOWN
 
-    return HealthCheckResponse(
+    return HealthCheckResponse.from_trusted(
         status=status,
         version="0.6.0",
         timestamp=datetime.now(UTC),
@@ -231,8 +431,7 @@ async def create_slide(
     Raises:
         HTTPException: タスク作成に失敗した場合（500）
     """
-    if task_manager is None:
-        raise HTTPException(status_code=500, detail="TaskManager not initialized")
+    task_manager = _require_task_manager()
 
     try:
         # タスク作成
@@ -243,12 +442,13 @@ async def create_slide(
         background_tasks.add_task(_run_create_workflow, task_id, request)
 
         # タスク情報を返す
-        return TaskResponse(
+        now = datetime.now(UTC)
+        return TaskResponse.from_trusted(
             task_id=task_id,
-            status="pending",
+            status=TaskStatus.PENDING,
             message="Task created successfully. Processing will start shortly.",
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=now,
+            updated_at=now,
         )
 
     except Exception as e:
@@ -272,8 +472,7 @@ async def convert_slide(
     Raises:
         HTTPException: タスク作成に失敗した場合（500）
     """
-    if task_manager is None:
-        raise HTTPException(status_code=500, detail="TaskManager not initialized")
+    task_manager = _require_task_manager()
 
     try:
         # タスク作成
@@ -284,12 +483,13 @@ async def convert_slide(
         background_tasks.add_task(_run_conversion_workflow, task_id, request)
 
         # タスク情報を返す
-        return TaskResponse(
+        now = datetime.now(UTC)
+        return TaskResponse.from_trusted(
             task_id=task_id,
-            status="pending",
+            status=TaskStatus.PENDING,
             message="Task created successfully. Processing will start shortly.",
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=now,
+            updated_at=now,
         )
 
     except Exception as e:
@@ -312,8 +512,7 @@ async def get_task_status(task_id: str) -> TaskStatusResponse:
             - 404: タスクが存在しない場合
             - 500: ステータス取得に失敗した場合
     """
-    if task_manager is None:
-        raise HTTPException(status_code=500, detail="TaskManager not initialized")
+    task_manager = _require_task_manager()
 
     try:
         status = await task_manager.get_task_status(task_id)
@@ -336,8 +535,111 @@ async def get_task_status(task_id: str) -> TaskStatusResponse:
 # ========================================
 
 
+# Base64デコードのチャンクサイズ（4の倍数であれば各チャンクを独立にデコードできる）
+_BASE64_CHUNK_SIZE = 256 * 1024
+
+
+def _decode_base64_to_file(encoded: str, path: Path) -> int:
+    """Base64文字列をチャンク単位でデコードしてファイルに書き込みます.
+
+    デコード結果全体を一度にメモリ上に展開しないため、最大50MBの入力でも
+    ピークメモリはBase64文字列本体とチャンク1つ分に抑えられます。
+
+    Note:
+        JSONリクエストではBase64が必須のためこの方式を採用しています。
+        multipart（UploadFile）に移行すればBase64自体（約33%のオーバーヘッド）と
+        デコード処理を省けますが、既存クライアントとの互換性が失われます。
+
+    Args:
+        encoded: Base64エンコードされた文字列
+        path: 書き込み先ファイルパス
+
+    Returns:
+        書き込んだバイト数
+
+    Raises:
+        ValueError: Base64エンコードが不正な場合
+    """
+    written = 0
+    with open(path, "wb") as f:
+        for start in range(0, len(encoded), _BASE64_CHUNK_SIZE):
+            chunk = encoded[start : start + _BASE64_CHUNK_SIZE]
+            try:
+                decoded = base64.b64decode(chunk, validate=True)
+            except Exception as e:
+                raise ValueError(f"Invalid Base64 encoding: {e}") from e
+            f.write(decoded)
+            written += len(decoded)
+    return written
+
+
+def _create_temp_file(suffix: str, directory: Path | str = "/tmp") -> Path:
+    """衝突しない一時ファイルを作成します.
+
+    タスクIDの一部からパスを組み立てると並行タスク間で上書きが起こり得るため、
+    ``tempfile.mkstemp``で一意なファイルを作成します。
+
+    Args:
+        suffix: ファイル拡張子（例: ".md"）
+        directory: 作成先ディレクトリ
+
+    Returns:
+        作成した空ファイルのパス
+    """
+    fd, name = tempfile.mkstemp(prefix="slidemaker_", suffix=suffix, dir=directory)
+    os.close(fd)
+    return Path(name)
+
+
+def _remove_temp_paths(*paths: Path | None) -> None:
+    """一時ファイル・ディレクトリを削除します（存在しないものは無視）.
+
+    Args:
+        *paths: 削除対象のパス（Noneは無視）
+    """
+    for path in paths:
+        if path is None:
+            continue
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+
+
+_SLIDE_ID_PATTERN = re.compile(rb"<p:sldId\b")
+
+
+def _count_slides(path: Path) -> int:
+    """PowerPointファイルのスライド枚数を取得します.
+
+    python-pptxで全スライドをパースせず、``ppt/presentation.xml``の
+    スライドIDリスト（``<p:sldId>``要素）のみを数えます。
+    ZIP読み込みを伴うため、``asyncio.to_thread``経由で呼び出します。
+
+    Args:
+        path: PowerPointファイルパス
+
+    Returns:
+        スライド枚数
+    """
+    with zipfile.ZipFile(path) as archive:
+        data = archive.read("ppt/presentation.xml")
+    return len(_SLIDE_ID_PATTERN.findall(data))
+
+
 async def _run_create_workflow(task_id: str, request: CreateSlideRequest) -> None:
-    """NewSlideWorkflowを実行します（バックグラウンド）.
+    """NewSlideWorkflowを同時実行数の制限付きで実行します（バックグラウンド）.
+
+    Args:
+        task_id: タスクID
+        request: スライド作成リクエスト
+    """
+    async with _get_workflow_semaphore():
+        await _execute_create_workflow(task_id, request)
+
+
+async def _execute_create_workflow(task_id: str, request: CreateSlideRequest) -> None:
+    """NewSlideWorkflowを実行します.
 
     Args:
         task_id: タスクID
@@ -346,27 +648,39 @@ async def _run_create_workflow(task_id: str, request: CreateSlideRequest) -> Non
     Note:
         エラーが発生した場合はTaskManager.set_task_error()を呼び出します。
     """
-    if task_manager is None or storage is None or llm_manager is None or file_manager is None:
+    try:
+        task_manager = _get_task_manager()
+        storage = _get_storage()
+        llm_manager = _get_llm_manager()
+        file_manager = _get_file_manager()
+    except ValueError:
         logger.error("Required managers not initialized", task_id=task_id)
         return
 
+    _load_workflow_modules()
+    from slidemaker.workflows.new_slide import NewSlideWorkflow
+
+    temp_markdown_path: Path | None = None
+    temp_output_path: Path | None = None
+
     try:
         # ステータス更新: processing
         await task_manager.update_task_status(
             task_id=task_id,
-            status="processing",
+            status=TaskStatus.PROCESSING,
             message="Starting slide generation workflow",
             progress=0.0,
         )
         logger.info("Create workflow started", task_id=task_id)
 
         # 出力ファイル名を決定
-        output_filename = request.output_filename or f"slides_{task_id[:8]}.pptx"
+        output_filename = request.output_filename or f"slides_{task_id}.pptx"
         if not output_filename.endswith(".pptx"):
             output_filename += ".pptx"
 
-        # 一時ファイルパス
-        temp_output_path = Path(f"/tmp/{output_filename}")
+        # 一時出力ファイル（ワークフローの出力パス検証のためFileManagerの出力先に作成）
+        file_manager.output_base_dir.mkdir(parents=True, exist_ok=True)
+        temp_output_path = _create_temp_file(".pptx", file_manager.output_base_dir)
 
         # NewSlideWorkflowを実行
         workflow = NewSlideWorkflow(
@@ -374,10 +688,11 @@ async def _run_create_workflow(task_id: str, request: CreateSlideRequest) -> Non
             file_manager=file_manager,
         )
 
-        # 一時Markdownファイルを作成
-        temp_markdown_path = Path(f"/tmp/input_{task_id[:8]}.md")
-        with open(temp_markdown_path, "w", encoding="utf-8") as f:
-            f.write(request.content)
+        # 一時Markdownファイルを作成（イベントループをブロックしないようスレッドで実行）
+        temp_markdown_path = _create_temp_file(".md")
+        await asyncio.to_thread(
+            temp_markdown_path.write_text, request.content, encoding="utf-8"
+        )
 
         result = await workflow.execute(
             input_data=temp_markdown_path,
@@ -385,42 +700,35 @@ async def _run_create_workflow(task_id: str, request: CreateSlideRequest) -> Non
             generate_images=True,  # 常に画像生成有効
         )
 
-        # 一時Markdownファイルを削除
-        if temp_markdown_path.exists():
-            temp_markdown_path.unlink()
-
         logger.info("Create workflow completed", task_id=task_id, output_path=str(result))
 
         # 進捗更新: 80%（S3アップロード前）
         await task_manager.update_task_status(
             task_id=task_id,
-            status="processing",
+            status=TaskStatus.PROCESSING,
             message="Uploading PowerPoint to S3",
             progress=0.8,
         )
 
-        # 結果をS3にアップロード
-        with open(result, "rb") as f:
-            pptx_data = f.read()
-
+        # 結果をS3にアップロード（ファイル全体をメモリに読み込まない）
+        # アップロード（I/O）、ページ数の算出（CPU）、署名付きURL生成（7日間有効）は
+        # 互いに独立しているため並行実行する（署名はオブジェクトの存在を必要としない）
         s3_key = f"outputs/{task_id}/{output_filename}"
-        await storage.upload_file(
-            file_data=pptx_data,
-            key=s3_key,
-            content_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        _, page_count, presigned_url = await asyncio.gather(
+            storage.upload_from_path(
+                path=result,
+                key=s3_key,
+                content_type=(
+                    "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+                ),
+            ),
+            asyncio.to_thread(_count_slides, result),
+            storage.generate_presigned_url(s3_key, expiration=604800),
         )
         logger.info("PowerPoint uploaded to S3", task_id=task_id, s3_key=s3_key)
 
-        # 署名付きURL生成（7日間有効）
-        presigned_url = await storage.generate_presigned_url(s3_key, expiration=604800)
-
-        # ファイルサイズとページ数を取得
-        file_size = len(pptx_data)
-        # python-pptxでページ数を取得
-        from pptx import Presentation as PptxPresentation
-
-        prs = PptxPresentation(str(result))
-        page_count = len(prs.slides)
+        # ファイルサイズを取得
+        file_size = result.stat().st_size
 
         # タスク完了
         await task_manager.set_task_result(
@@ -433,29 +741,43 @@ async def _run_create_workflow(task_id: str, request: CreateSlideRequest) -> Non
 
         logger.info("Create workflow task completed successfully", task_id=task_id)
 
-        # 一時ファイルを削除
-        if temp_output_path.exists():
-            temp_output_path.unlink()
-
     except Exception as e:
+        tb = traceback.format_exc()
         logger.error(
             "Create workflow failed",
             task_id=task_id,
             error=str(e),
-            traceback=traceback.format_exc(),
+            traceback=tb,
         )
         await task_manager.set_task_error(
             task_id=task_id,
             error_code="INTERNAL_ERROR",
             error_message=f"Workflow execution failed: {str(e)}",
-            details={"traceback": traceback.format_exc()},
+            details={"traceback": tb},
         )
 
+    finally:
+        # 成功・失敗に関わらず一時ファイルを削除（/tmpの容量枯渇を防ぐ）
+        await asyncio.to_thread(_remove_temp_paths, temp_markdown_path, temp_output_path)
+
 
 async def _run_conversion_workflow(
     task_id: str, request: ConvertSlideRequest
 ) -> None:
-    """ConversionWorkflowを実行します（バックグラウンド）.
+    """ConversionWorkflowを同時実行数の制限付きで実行します（バックグラウンド）.
+
+    Args:
+        task_id: タスクID
+        request: スライド変換リクエスト
+    """
+    async with _get_workflow_semaphore():
+        await _execute_conversion_workflow(task_id, request)
+
+
+async def _execute_conversion_workflow(
+    task_id: str, request: ConvertSlideRequest
+) -> None:
+    """ConversionWorkflowを実行します.
 
     Args:
         task_id: タスクID
@@ -464,69 +786,83 @@ async def _run_conversion_workflow(
     Note:
         エラーが発生した場合はTaskManager.set_task_error()を呼び出します。
     """
-    if task_manager is None or storage is None or llm_manager is None or file_manager is None:
+    try:
+        task_manager = _get_task_manager()
+        storage = _get_storage()
+        llm_manager = _get_llm_manager()
+        file_manager = _get_file_manager()
+    except ValueError:
         logger.error("Required managers not initialized", task_id=task_id)
         return
 
+    _load_workflow_modules()
+    from slidemaker.core.models.slide_config import SlideConfig
+    from slidemaker.pptx.generator import PowerPointGenerator
+    from slidemaker.workflows.conversion import ConversionWorkflow
+
     temp_input_path: Path | None = None
     temp_output_path: Path | None = None
+    work_dir: Path | None = None
 
     try:
         # ステータス更新: processing
         await task_manager.update_task_status(
             task_id=task_id,
-            status="processing",
+            status=TaskStatus.PROCESSING,
             message="Starting conversion workflow",
             progress=0.0,
         )
         logger.info("Conversion workflow started", task_id=task_id)
 
-        # Base64デコード
-        try:
-            file_data = base64.b64decode(request.file_data, validate=True)
-        except Exception as e:
-            raise ValueError(f"Invalid Base64 encoding: {e}") from e
-
-        # 一時ファイルに保存
+        # Base64をチャンク単位でデコードしながら一時ファイルに保存
+        # （デコードとディスク書き込みはブロッキング処理のためスレッドで実行）
         file_extension = ".pdf" if request.file_type == "pdf" else ".png"
-        temp_input_path = Path(f"/tmp/input_{task_id[:8]}{file_extension}")
-        with open(temp_input_path, "wb") as f:
-            f.write(file_data)
+        temp_input_path = _create_temp_file(file_extension)
+        file_size = await asyncio.to_thread(
+            _decode_base64_to_file, request.file_data, temp_input_path
+        )
 
         logger.info(
             "Input file saved",
             task_id=task_id,
             file_type=request.file_type,
-            file_size=len(file_data),
+            file_size=file_size,
         )
 
         # 設定を構築
         slide_config = request.config.to_slide_config() if request.config else None
 
         # 出力ファイル名を決定
-        output_filename = request.output_filename or f"converted_{task_id[:8]}.pptx"
+        output_filename = request.output_filename or f"converted_{task_id}.pptx"
         if not output_filename.endswith(".pptx"):
             output_filename += ".pptx"
 
-        # 一時出力ファイルパス
-        temp_output_path = Path(f"/tmp/{output_filename}")
+        # 一時出力ファイル（ワークフローの出力パス検証のためFileManagerの出力先に作成）
+        file_manager.output_base_dir.mkdir(parents=True, exist_ok=True)
+        temp_output_path = _create_temp_file(".pptx", file_manager.output_base_dir)
+
+        # 切り出し画像などの作業ディレクトリ（並行タスク間で共有しない）
+        work_dir = Path(tempfile.mkdtemp(prefix="slidemaker_work_"))
 
         # ConversionWorkflowを実行
         # デフォルトのSlideConfigを使用
         default_config = slide_config or SlideConfig()
 
+        # 画像処理コンポーネントは起動時に構築済みのものを再利用する。
+        # PowerPointGeneratorは生成したスライドをPresentationに蓄積するため共有できない。
         workflow = ConversionWorkflow(
             llm_manager=llm_manager,
             file_manager=file_manager,
-            image_loader=ImageLoader(file_manager=file_manager),
-            image_analyzer=ImageAnalyzer(llm_manager=llm_manager),
-            image_processor=ImageProcessor(file_manager=file_manager),
+            image_loader=_get_image_loader(),
+            image_analyzer=_get_image_analyzer(),
+            image_processor=_get_image_processor(),
             powerpoint_generator=PowerPointGenerator(config=default_config),
         )
 
         result = await workflow.execute(
             input_data=temp_input_path,
             output_path=temp_output_path,
+            temp_dir=work_dir,
         )
 
         logger.info("Conversion workflow completed", task_id=task_id, output_path=str(result))
@@ -534,33 +870,30 @@ async def _run_conversion_workflow(
         # 進捗更新: 80%（S3アップロード前）
         await task_manager.update_task_status(
             task_id=task_id,
-            status="processing",
+            status=TaskStatus.PROCESSING,
             message="Uploading PowerPoint to S3",
             progress=0.8,
         )
 
-        # 結果をS3にアップロード
-        with open(result, "rb") as f:
-            pptx_data = f.read()
-
+        # 結果をS3にアップロード（ファイル全体をメモリに読み込まない）
+        # アップロード（I/O）、ページ数の算出（CPU）、署名付きURL生成（7日間有効）は
+        # 互いに独立しているため並行実行する（署名はオブジェクトの存在を必要としない）
         s3_key = f"outputs/{task_id}/{output_filename}"
-        await storage.upload_file(
-            file_data=pptx_data,
-            key=s3_key,
-            content_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        _, page_count, presigned_url = await asyncio.gather(
+            storage.upload_from_path(
+                path=result,
+                key=s3_key,
+                content_type=(
+                    "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+                ),
+            ),
+            asyncio.to_thread(_count_slides, result),
+            storage.generate_presigned_url(s3_key, expiration=604800),
         )
         logger.info("PowerPoint uploaded to S3", task_id=task_id, s3_key=s3_key)
 
-        # 署名付きURL生成（7日間有効）
-        presigned_url = await storage.generate_presigned_url(s3_key, expiration=604800)
-
-        # ファイルサイズとページ数を取得
-        file_size = len(pptx_data)
-        # python-pptxでページ数を取得
-        from pptx import Presentation as PptxPresentation
-
-        prs = PptxPresentation(str(result))
-        page_count = len(prs.slides)
+        # ファイルサイズを取得
+        file_size = result.stat().st_size
 
         # タスク完了
         await task_manager.set_task_result(
@@ -573,31 +906,26 @@ async def _run_conversion_workflow(
 
         logger.info("Conversion workflow task completed successfully", task_id=task_id)
 
-        # 一時ファイルを削除
-        if temp_input_path and temp_input_path.exists():
-            temp_input_path.unlink()
-        if temp_output_path and temp_output_path.exists():
-            temp_output_path.unlink()
-
     except Exception as e:
+        tb = traceback.format_exc()
         logger.error(
             "Conversion workflow failed",
             task_id=task_id,
             error=str(e),
-            traceback=traceback.format_exc(),
+            traceback=tb,
         )
         await task_manager.set_task_error(
             task_id=task_id,
             error_code="INTERNAL_ERROR",
             error_message=f"Workflow execution failed: {str(e)}",
-            details={"traceback": traceback.format_exc()},
+            details={"traceback": tb},
         )
 
-        # クリーンアップ
-        if temp_input_path and temp_input_path.exists():
-            temp_input_path.unlink()
-        if temp_output_path and temp_output_path.exists():
-            temp_output_path.unlink()
+    finally:
+        # 成功・失敗に関わらず一時ファイルを削除（/tmpの容量枯渇を防ぐ）
+        await asyncio.to_thread(
+            _remove_temp_paths, temp_input_path, temp_output_path, work_dir
+        )
 
 
 # ========================================
@@ -10,6 +10,10 @@ Exported Schemas:
         - SlideConfigSchema: スライド設定スキーマ
         - TaskStatusRequest: タスクステータス照会リクエスト
 
+    Enums:
+        - TaskStatus: タスクステータス
+        - HealthStatus: ヘルスチェックステータス
+
     Response Schemas:
         - TaskResponse: タスク作成レスポンス
         - TaskStatusResponse: タスクステータスレスポンス
@@ -33,6 +37,7 @@ Example:
     ... )
 """
 
+from slidemaker.api.schemas.enums import HealthStatus, TaskStatus
 from slidemaker.api.schemas.requests import (
     ConvertSlideRequest,
     CreateSlideRequest,
@@ -53,6 +58,9 @@ __all__ = [
     "CreateSlideRequest",
     "SlideConfigSchema",
     "TaskStatusRequest",
+    # Enums
+    "TaskStatus",
+    "HealthStatus",
     # Response schemas
     "TaskResponse",
     "TaskStatusResponse",
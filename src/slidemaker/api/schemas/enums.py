@@ -0,0 +1,20 @@
+"""Enumerations shared by the API schemas."""
+
+from enum import StrEnum
+
+
+class TaskStatus(StrEnum):
+    """Lifecycle states of an asynchronous task."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class HealthStatus(StrEnum):
+    """Overall service status reported by the health check."""
+
+    OK = "ok"
+    DEGRADED = "degraded"
+    DOWN = "down"
@@ -6,7 +6,7 @@ All models include comprehensive validation to ensure data integrity and securit
 
 from __future__ import annotations
 
-import base64
+import re
 from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel, Field, field_validator
@@ -17,6 +17,60 @@ from slidemaker.core.models.slide_config import BackgroundConfig
 if TYPE_CHECKING:
     from slidemaker.core.models.slide_config import SlideConfig
 
+# Lookup table marking ASCII hex digits (1) by byte value
+_HEX_LUT = bytes(1 if c in b"0123456789abcdefABCDEF" else 0 for c in range(256))
+
+# Maximum decoded file size (50MB) and the longest Base64 string that can encode it
+_MAX_FILE_SIZE = 50 * 1024 * 1024
+_MAX_BASE64_LENGTH = ((_MAX_FILE_SIZE + 2) // 3) * 4
+
+# Directory separators that must not appear in output filenames
+_PATH_SEPARATORS = frozenset("/\\")
+
+
+def _validate_filename(v: str | None) -> str | None:
+    """Validate an output filename to prevent path traversal attacks.
+
+    Shared by the request schemas that accept ``output_filename``. The separator
+    check is a single scan; the absolute-path distinction is only made on failure.
+
+    Args:
+        v: Output filename
+
+    Returns:
+        Validated filename
+
+    Raises:
+        ValueError: If filename contains path traversal characters
+    """
+    if v is None:
+        return v
+
+    # Security: Prevent path traversal
+    if ".." in v:
+        raise ValueError(
+            "Invalid output filename: path traversal characters (..) are not allowed"
+        )
+
+    # Security: Prevent absolute paths and directory separators
+    if not _PATH_SEPARATORS.isdisjoint(v):
+        if v[0] in _PATH_SEPARATORS:
+            raise ValueError("Invalid output filename: absolute paths are not allowed")
+        raise ValueError(
+            "Invalid output filename: directory separators (/ or \\) are not allowed"
+        )
+
+    return v
+
+
+# Strict Base64 alphabet with optional trailing padding (same rules as b64decode(validate=True))
+_BASE64_PATTERN = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
+# Canonical 8-4-4-4-12 UUID string
+_UUID_PATTERN = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+
 
 class SlideConfigSchema(BaseModel):
     """Simplified slide configuration schema for API requests.
@@ -63,13 +117,12 @@ class SlideConfigSchema(BaseModel):
             raise ValueError(
                 "Invalid hex color format. Must be '#RGB' or '#RRGGBB' (e.g., '#FFF' or '#FFFFFF')"
             )
-        try:
-            # Validate hex digits
-            int(v[1:], 16)
-        except ValueError as e:
+        # Validate hex digits with a table lookup (int() would also accept "+", "_", spaces)
+        digits = v[1:]
+        if not digits.isascii() or not all(_HEX_LUT[c] for c in digits.encode("ascii")):
             raise ValueError(
                 f"Invalid hex color value: {v}. Must contain only hex digits (0-9, A-F)"
-            ) from e
+            )
         return v.upper()
 
     def to_slide_config(self) -> SlideConfig:
@@ -126,26 +179,7 @@ class CreateSlideRequest(BaseModel):
         Raises:
             ValueError: If filename contains path traversal characters
         """
-        if v is None:
-            return v
-
-        # Security: Prevent path traversal
-        if ".." in v:
-            raise ValueError(
-                "Invalid output filename: path traversal characters (..) are not allowed"
-            )
-
-        # Security: Prevent absolute paths
-        if v.startswith("/") or v.startswith("\\"):
-            raise ValueError("Invalid output filename: absolute paths are not allowed")
-
-        # Security: Prevent directory separators
-        if "/" in v or "\\" in v:
-            raise ValueError(
-                "Invalid output filename: directory separators (/ or \\) are not allowed"
-            )
-
-        return v
+        return _validate_filename(v)
 
 
 class ConvertSlideRequest(BaseModel):
@@ -185,21 +219,28 @@ class ConvertSlideRequest(BaseModel):
         Raises:
             ValueError: If Base64 format is invalid or file size exceeds limit
         """
+        # The decoded size follows from the string length, so the payload is never decoded
+        # here; the workflow decodes it once, streaming to disk.
+        size_error = (
+            "File size exceeds limit: {size} bytes "
+            f"(maximum allowed: {_MAX_FILE_SIZE} bytes / 50MB)"
+        )
+
+        # Security: Reject oversized payloads before scanning them
+        if len(v) > _MAX_BASE64_LENGTH:
+            raise ValueError(size_error.format(size=len(v) // 4 * 3))
+
         # Security: Validate Base64 format
-        try:
-            decoded = base64.b64decode(v, validate=True)
-        except Exception as e:
+        if len(v) % 4 != 0 or _BASE64_PATTERN.fullmatch(v) is None:
             raise ValueError(
-                f"Invalid Base64 encoding: {e}. File data must be properly Base64-encoded."
-            ) from e
+                "Invalid Base64 encoding: File data must be properly Base64-encoded."
+            )
 
         # Security: Check file size limit (50MB)
-        max_size = 50 * 1024 * 1024  # 50MB in bytes
-        if len(decoded) > max_size:
-            raise ValueError(
-                f"File size exceeds limit: {len(decoded)} bytes "
-                f"(maximum allowed: {max_size} bytes / 50MB)"
-            )
+        padding = 2 if v.endswith("==") else 1 if v.endswith("=") else 0
+        decoded_size = len(v) // 4 * 3 - padding
+        if decoded_size > _MAX_FILE_SIZE:
+            raise ValueError(size_error.format(size=decoded_size))
 
         return v
 
@@ -217,26 +258,7 @@ class ConvertSlideRequest(BaseModel):
         Raises:
             ValueError: If filename contains path traversal characters
         """
-        if v is None:
-            return v
-
-        # Security: Prevent path traversal
-        if ".." in v:
-            raise ValueError(
-                "Invalid output filename: path traversal characters (..) are not allowed"
-            )
-
-        # Security: Prevent absolute paths
-        if v.startswith("/") or v.startswith("\\"):
-            raise ValueError("Invalid output filename: absolute paths are not allowed")
-
-        # Security: Prevent directory separators
-        if "/" in v or "\\" in v:
-            raise ValueError(
-                "Invalid output filename: directory separators (/ or \\) are not allowed"
-            )
-
-        return v
+        return _validate_filename(v)
 
 
 class TaskStatusRequest(BaseModel):
@@ -266,15 +288,11 @@ class TaskStatusRequest(BaseModel):
         Raises:
             ValueError: If task ID is not a valid UUID format
         """
-        import uuid
-
-        try:
-            # Parse as UUID to validate format
-            uuid.UUID(v)
-        except ValueError as e:
+        # Match the canonical format directly instead of constructing a UUID object
+        if _UUID_PATTERN.fullmatch(v) is None:
             raise ValueError(
                 f"Invalid task ID format: {v}. Must be a valid UUID (e.g., "
                 "'550e8400-e29b-41d4-a716-446655440000')"
-            ) from e
+            )
 
         return v
@@ -20,12 +20,56 @@ Example:
 """
 
 from datetime import datetime, timezone  # noqa: F401 (used in docstring examples)
-from typing import Any, Literal
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from slidemaker.api.schemas.enums import HealthStatus, TaskStatus
 
-class TaskResponse(BaseModel):
+
+class _ResponseModel(BaseModel):
+    """レスポンスモデルの基底クラス
+
+    レスポンスはサーバー側（タスクストア、S3メタデータ）で組み立てた
+    信頼済みデータのみから生成されるため、バリデーションを省略する
+    ``from_trusted``を提供します。外部入力の検証はrequests.pyのモデルで行います。
+
+    生成後に変更されることはないためfrozenとし、未定義フィールドは拒否します。
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> Self:
+        """信頼済みデータからバリデーションなしでインスタンスを生成します.
+
+        ``model_construct``のラッパーです。型変換も行わないため、
+        datetime・ネストしたモデル等は呼び出し側で変換済みである必要があります。
+
+        Args:
+            **data: フィールド値
+
+        Returns:
+            生成されたインスタンス
+        """
+        return cls.model_construct(**data)
+
+
+# OpenAPIスキーマのサンプル値（各モデルのjson_schema_extraから参照）。
+# pydanticはjson_schema_extraにdictかcallableのみを受け付けるため、
+# MappingProxyTypeではなく通常のdictとして定義しています。
+_TASK_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "example": {
+        "task_id": "123e4567-e89b-12d3-a456-426614174000",
+        "status": "pending",
+        "message": "Task created successfully",
+        "created_at": "2024-01-15T10:30:00Z",
+        "updated_at": "2024-01-15T10:30:00Z"
+    }
+}
+
+
+class TaskResponse(_ResponseModel):
     """タスク作成時の基本レスポンス
 
     タスク作成APIエンドポイントからのレスポンスを表します。
@@ -53,7 +97,7 @@ class TaskResponse(BaseModel):
         description="タスクID（UUID形式）",
         examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
-    status: Literal["pending", "processing", "completed", "failed"] = Field(
+    status: TaskStatus = Field(
         ...,
         description="タスクステータス"
     )
@@ -71,21 +115,20 @@ class TaskResponse(BaseModel):
         description="最終更新日時（UTC）"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "task_id": "123e4567-e89b-12d3-a456-426614174000",
-                "status": "pending",
-                "message": "Task created successfully",
-                "created_at": "2024-01-15T10:30:00Z",
-                "updated_at": "2024-01-15T10:30:00Z"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_TASK_RESPONSE_EXAMPLE)
+
 
+_TASK_RESULT_EXAMPLE: dict[str, Any] = {
+    "example": {
+        "output_url": "https://s3.amazonaws.com/bucket/presentation.pptx?signature=...",
+        "output_filename": "presentation.pptx",
+        "file_size": 1024000,
+        "page_count": 10
+    }
+}
 
-class TaskResult(BaseModel):
+
+class TaskResult(_ResponseModel):
     """タスク完了時の結果情報
 
     タスクが正常に完了した場合の結果情報を表します。
@@ -129,20 +172,22 @@ class TaskResult(BaseModel):
         examples=[10, 25]
     )
 
-    class Config:
-        """Pydantic config."""
+    model_config = ConfigDict(json_schema_extra=_TASK_RESULT_EXAMPLE)
+
 
-        json_schema_extra = {
-            "example": {
-                "output_url": "https://s3.amazonaws.com/bucket/presentation.pptx?signature=...",
-                "output_filename": "presentation.pptx",
-                "file_size": 1024000,
-                "page_count": 10
-            }
+_ERROR_DETAIL_EXAMPLE: dict[str, Any] = {
+    "example": {
+        "error_code": "VALIDATION_ERROR",
+        "error_message": "Invalid input format",
+        "details": {
+            "field": "markdown_content",
+            "issue": "Empty content"
         }
+    }
+}
 
 
-class ErrorDetail(BaseModel):
+class ErrorDetail(_ResponseModel):
     """エラー詳細情報
 
     タスクが失敗した場合のエラー詳細を表します。
@@ -183,19 +228,26 @@ class ErrorDetail(BaseModel):
         description="追加の詳細情報（オプション）"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "error_code": "VALIDATION_ERROR",
-                "error_message": "Invalid input format",
-                "details": {
-                    "field": "markdown_content",
-                    "issue": "Empty content"
-                }
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_ERROR_DETAIL_EXAMPLE)
+
+
+_TASK_STATUS_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "example": {
+        "task_id": "123e4567-e89b-12d3-a456-426614174000",
+        "status": "completed",
+        "message": "Task completed successfully",
+        "created_at": "2024-01-15T10:30:00Z",
+        "updated_at": "2024-01-15T10:35:00Z",
+        "result": {
+            "output_url": "https://s3.amazonaws.com/bucket/presentation.pptx?signature=...",
+            "output_filename": "presentation.pptx",
+            "file_size": 1024000,
+            "page_count": 10
+        },
+        "error": None,
+        "progress": None
+    }
+}
 
 
 class TaskStatusResponse(TaskResponse):
@@ -247,29 +299,23 @@ class TaskStatusResponse(TaskResponse):
         description="進捗率（status='processing'の場合のみ、0.0-1.0）"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "task_id": "123e4567-e89b-12d3-a456-426614174000",
-                "status": "completed",
-                "message": "Task completed successfully",
-                "created_at": "2024-01-15T10:30:00Z",
-                "updated_at": "2024-01-15T10:35:00Z",
-                "result": {
-                    "output_url": "https://s3.amazonaws.com/bucket/presentation.pptx?signature=...",
-                    "output_filename": "presentation.pptx",
-                    "file_size": 1024000,
-                    "page_count": 10
-                },
-                "error": None,
-                "progress": None
-            }
+    model_config = ConfigDict(json_schema_extra=_TASK_STATUS_RESPONSE_EXAMPLE)
+
+
+_HEALTH_CHECK_RESPONSE_EXAMPLE: dict[str, Any] = {
+    "example": {
+        "status": "ok",
+        "version": "0.1.0",
+        "timestamp": "2024-01-15T10:30:00Z",
+        "checks": {
+            "llm_available": True,
+            "storage_available": True
         }
+    }
+}
 
 
-class HealthCheckResponse(BaseModel):
+class HealthCheckResponse(_ResponseModel):
     """ヘルスチェックエンドポイントのレスポンス
 
     サービスの健全性チェック結果を表します。
@@ -298,7 +344,7 @@ class HealthCheckResponse(BaseModel):
         ... )
     """
 
-    status: Literal["ok", "degraded", "down"] = Field(
+    status: HealthStatus = Field(
         ...,
         description="サービス全体のステータス"
     )
@@ -316,17 +362,4 @@ class HealthCheckResponse(BaseModel):
         description="各種チェック結果"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
-            "example": {
-                "status": "ok",
-                "version": "0.1.0",
-                "timestamp": "2024-01-15T10:30:00Z",
-                "checks": {
-                    "llm_available": True,
-                    "storage_available": True
-                }
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_HEALTH_CHECK_RESPONSE_EXAMPLE)
@@ -1,19 +1,82 @@
 """S3 storage management for slidemaker API."""
 
-import json
-from datetime import UTC, datetime
+import asyncio
+import functools
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import aiobotocore.session
+import orjson
 from botocore.exceptions import ClientError
 
 from slidemaker.utils.logger import get_logger
 
 if TYPE_CHECKING:
+    from aiobotocore.session import AioSession
+    from botocore.config import Config
     from types_aiobotocore_s3 import S3Client
 
 logger = get_logger(__name__)
 
+# Files larger than one part are uploaded with S3 multipart upload so that the
+# whole object never has to be held in memory.
+_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+_MULTIPART_MAX_CONCURRENCY = 8
+
+# Chunk size used when streaming object bodies out of S3.
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of keys accepted by a single DeleteObjects request.
+_DELETE_BATCH_SIZE = 1000
+
+
+# Error codes S3 returns when a conditional write loses against another writer.
+_PRECONDITION_ERROR_CODES = frozenset({"PreconditionFailed", "ConditionalRequestConflict"})
+
+
+class PreconditionFailedError(Exception):
+    """Raised when a conditional write fails because the object has changed."""
+
+
+# aiobotocore and botocore.config together take several hundred milliseconds to
+# import, so they are loaded on first client creation rather than at import time.
+
+
+@functools.cache
+def _get_session() -> "AioSession":
+    """Return the process-wide aiobotocore session.
+
+    The session's loader caches parsed service models, so sharing it means the
+    S3 model is only loaded once no matter how many clients are created.
+    """
+    import aiobotocore.session
+
+    return aiobotocore.session.get_session()
+
+
+@functools.cache
+def _get_client_config() -> "Config":
+    """Return the connection pool settings shared by every S3 client.
+
+    TCP keep-alive lets warm Lambda invocations reuse pooled connections instead
+    of paying a fresh TLS handshake, and the larger pool avoids "Timeout waiting
+    for connection from pool" under burst load.
+    """
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive"},
+    )
+
+
+def _read_chunk(path: Path, offset: int, size: int) -> bytes:
+    """Read ``size`` bytes of ``path`` starting at ``offset``."""
+    with path.open("rb") as f:
+        f.seek(offset)
+        return f.read(size)
+
 
 class S3Storage:
     """Manages file upload, download, and signed URL generation for AWS S3.
@@ -25,24 +88,36 @@ class S3Storage:
 
     All operations use SSE-S3 encryption for data at rest.
 
+    An already-open client can be injected so that several storages (or an
+    application-wide lifespan) share one connection pool; injected clients are
+    never closed by this class.
+
     Example:
         async with S3Storage(bucket_name="my-bucket") as storage:
             await storage.upload_file(data, "outputs/presentation.pptx")
             url = await storage.generate_presigned_url("outputs/presentation.pptx")
     """
 
-    def __init__(self, bucket_name: str, region: str = "us-east-1") -> None:
+    def __init__(
+        self,
+        bucket_name: str,
+        region: str = "us-east-1",
+        client: "S3Client | None" = None,
+    ) -> None:
         """
         Initialize S3Storage.
 
         Args:
             bucket_name: S3 bucket name (from environment variable S3_BUCKET_NAME)
             region: AWS region (from environment variable AWS_REGION, defaults to "us-east-1")
+            client: Open S3 client to use instead of creating one in ``__aenter__``
         """
         self.bucket_name = bucket_name
         self.region = region
-        self.session = aiobotocore.session.get_session()
-        self._client: S3Client | None = None
+        self._client: S3Client | None = client
+        self._owns_client = client is None
+        # Every record from this instance carries the bucket name
+        self._logger = logger.bind(bucket=bucket_name)
 
         logger.info(
             "S3Storage initialized",
@@ -50,12 +125,24 @@ class S3Storage:
             region=region,
         )
 
+    @property
+    def session(self) -> "AioSession":
+        """Process-wide aiobotocore session used to create clients."""
+        return _get_session()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the S3 client has been created via ``__aenter__``."""
+        return self._client is not None
+
     async def __aenter__(self) -> "S3Storage":
         """Async context manager entry."""
-        self._client = await self.session.create_client(
-            "s3", region_name=self.region
-        ).__aenter__()
-        logger.debug("S3 client created")
+        if self._client is None:
+            self._client = await self.session.create_client(
+                "s3", region_name=self.region, config=_get_client_config()
+            ).__aenter__()
+            self._owns_client = True
+            self._logger.debug("S3 client created")
         return self
 
     async def __aexit__(
@@ -65,9 +152,10 @@ class S3Storage:
         exc_tb: Any,
     ) -> None:
         """Async context manager exit."""
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.__aexit__(exc_type, exc_val, exc_tb)
-            logger.debug("S3 client closed")
+            self._client = None
+            self._logger.debug("S3 client closed")
 
     async def upload_file(
         self, file_data: bytes, key: str, content_type: str = "application/octet-stream"
@@ -87,43 +175,206 @@ class S3Storage:
             RuntimeError: If S3 client is not initialized
             ClientError: If S3 upload fails
         """
+        await self._put_object(file_data, key, content_type)
+        return key
+
+    async def _put_object(
+        self,
+        file_data: bytes,
+        key: str,
+        content_type: str,
+        if_match: str | None = None,
+    ) -> str:
+        """
+        Issue PutObject, optionally conditioned on the current ETag.
+
+        Args:
+            file_data: Binary data to upload
+            key: S3 object key
+            content_type: Content-Type header
+            if_match: Only overwrite the object if its ETag still equals this value
+
+        Returns:
+            ETag of the written object
+
+        Raises:
+            RuntimeError: If S3 client is not initialized
+            PreconditionFailedError: If if_match is given and the object has changed
+            ClientError: If S3 upload fails
+        """
         if not self._client:
             raise RuntimeError("S3Storage not initialized. Use 'async with' context manager.")
 
+        conditions = {"IfMatch": if_match} if if_match is not None else {}
         try:
-            await self._client.put_object(
+            response = await self._client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
                 Body=file_data,
                 ContentType=content_type,
                 ServerSideEncryption="AES256",
+                **conditions,
             )
-            logger.info(
+            self._logger.debug(
                 "File uploaded to S3",
-                bucket=self.bucket_name,
                 key=key,
                 size_bytes=len(file_data),
             )
+            etag: str = response["ETag"]
+            return etag
+
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            if if_match is not None and error_code in _PRECONDITION_ERROR_CODES:
+                self._logger.debug("S3 conditional write rejected", key=key)
+                raise PreconditionFailedError(f"S3 object changed: {key}") from e
+
+            self._logger.error(
+                "S3 upload failed",
+                key=key,
+                error=str(e),
+            )
+            raise
+
+    async def upload_from_path(
+        self, path: Path, key: str, content_type: str = "application/octet-stream"
+    ) -> str:
+        """
+        Upload a local file to S3 without loading it into memory at once.
+
+        Files up to 8 MiB are sent with a single PutObject. Larger files use a
+        multipart upload with 8 MiB parts, up to 8 of which are read (in worker
+        threads, so the event loop is not blocked) and sent concurrently.
+
+        Args:
+            path: Local file to upload
+            key: S3 object key (e.g., "outputs/presentation.pptx")
+            content_type: Content-Type header (default: "application/octet-stream")
+
+        Returns:
+            S3 object key
+
+        Raises:
+            RuntimeError: If S3 client is not initialized
+            ClientError: If S3 upload fails
+        """
+        if not self._client:
+            raise RuntimeError("S3Storage not initialized. Use 'async with' context manager.")
+
+        file_size = path.stat().st_size
+
+        try:
+            if file_size <= _MULTIPART_CHUNK_SIZE:
+                body = await asyncio.to_thread(path.read_bytes)
+                await self._client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=body,
+                    ContentType=content_type,
+                    ServerSideEncryption="AES256",
+                )
+            else:
+                await self._multipart_upload(path, key, content_type, file_size)
+
+            self._logger.debug(
+                "File uploaded to S3",
+                key=key,
+                size_bytes=file_size,
+            )
             return key
 
         except ClientError as e:
-            logger.error(
+            self._logger.error(
                 "S3 upload failed",
-                bucket=self.bucket_name,
                 key=key,
                 error=str(e),
             )
             raise
 
-    async def download_file(self, key: str) -> bytes:
+    async def _multipart_upload(
+        self, path: Path, key: str, content_type: str, file_size: int
+    ) -> None:
         """
-        Download file from S3.
+        Upload ``path`` with S3 multipart upload, aborting it on failure.
+
+        Args:
+            path: Local file to upload
+            key: S3 object key
+            content_type: Content-Type header
+            file_size: Size of ``path`` in bytes
+
+        Raises:
+            RuntimeError: If S3 client is not initialized
+            ClientError: If any multipart API call fails
+        """
+        client = self._client
+        if not client:
+            raise RuntimeError("S3Storage not initialized. Use 'async with' context manager.")
+
+        upload = await client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            ContentType=content_type,
+            ServerSideEncryption="AES256",
+        )
+        upload_id = upload["UploadId"]
+        semaphore = asyncio.Semaphore(_MULTIPART_MAX_CONCURRENCY)
+
+        async def upload_part(part_number: int, offset: int) -> dict[str, Any]:
+            async with semaphore:
+                data = await asyncio.to_thread(_read_chunk, path, offset, _MULTIPART_CHUNK_SIZE)
+                response = await client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data,
+                )
+            return {"ETag": response["ETag"], "PartNumber": part_number}
+
+        try:
+            # TaskGroup cancels and awaits the remaining parts when one fails,
+            # so no part can land after the abort below
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    part_tasks = [
+                        tg.create_task(upload_part(part_number, offset))
+                        for part_number, offset in enumerate(
+                            range(0, file_size, _MULTIPART_CHUNK_SIZE), start=1
+                        )
+                    ]
+            except BaseExceptionGroup as eg:
+                # Surface the first part failure (e.g. ClientError) to callers
+                raise eg.exceptions[0] from eg
+            await client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": [task.result() for task in part_tasks]},
+            )
+        except BaseException:
+            try:
+                await client.abort_multipart_upload(
+                    Bucket=self.bucket_name, Key=key, UploadId=upload_id
+                )
+            except Exception as abort_error:
+                self._logger.error(
+                    "S3 multipart upload abort failed",
+                    key=key,
+                    upload_id=upload_id,
+                    error=str(abort_error),
+                )
+            raise
+
+    async def _get_object(self, key: str) -> dict[str, Any]:
+        """
+        Issue GetObject and translate a missing key into FileNotFoundError.
 
         Args:
             key: S3 object key
 
         Returns:
-            File binary data
+            GetObject response (the caller owns ``response["Body"]``)
 
         Raises:
             RuntimeError: If S3 client is not initialized
@@ -134,53 +385,110 @@ class S3Storage:
             raise RuntimeError("S3Storage not initialized. Use 'async with' context manager.")
 
         try:
-            response = await self._client.get_object(Bucket=self.bucket_name, Key=key)
-            body = response["Body"]
-            data: bytes = await body.read()
-            logger.debug(
-                "File downloaded from S3",
-                bucket=self.bucket_name,
-                key=key,
-                size_bytes=len(data),
+            response: dict[str, Any] = await self._client.get_object(
+                Bucket=self.bucket_name, Key=key
             )
-            return data
+            return response
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
             if error_code == "NoSuchKey":
-                logger.error(
+                self._logger.error(
                     "S3 object not found",
-                    bucket=self.bucket_name,
                     key=key,
                 )
                 raise FileNotFoundError(f"S3 object not found: {key}") from e
 
-            logger.error(
+            self._logger.error(
                 "S3 download failed",
-                bucket=self.bucket_name,
                 key=key,
                 error=str(e),
             )
             raise
 
-    async def upload_json(self, key: str, data: dict[str, Any]) -> None:
+    async def download_file(self, key: str) -> bytes:
+        """
+        Download file from S3.
+
+        Buffers the whole object in memory; prefer download_stream for large files.
+
+        Args:
+            key: S3 object key
+
+        Returns:
+            File binary data
+
+        Raises:
+            RuntimeError: If S3 client is not initialized
+            FileNotFoundError: If object does not exist
+            ClientError: If S3 download fails
+        """
+        response = await self._get_object(key)
+        async with response["Body"] as body:
+            data: bytes = await body.read()
+        self._logger.debug(
+            "File downloaded from S3",
+            key=key,
+            size_bytes=len(data),
+        )
+        return data
+
+    async def download_stream(
+        self, key: str, chunk_size: int = _STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Download file from S3 as a stream of chunks.
+
+        Only one chunk is held in memory at a time, so the iterator can be
+        handed directly to a streaming HTTP response.
+
+        Args:
+            key: S3 object key
+            chunk_size: Maximum size of each yielded chunk in bytes
+
+        Yields:
+            Consecutive chunks of the object body
+
+        Raises:
+            RuntimeError: If S3 client is not initialized
+            FileNotFoundError: If object does not exist
+            ClientError: If S3 download fails
+        """
+        response = await self._get_object(key)
+        async with response["Body"] as body:
+            async for chunk in body.iter_chunks(chunk_size):
+                yield chunk
+
+    async def upload_json(
+        self, key: str, data: dict[str, Any], if_match: str | None = None
+    ) -> str:
         """
         Upload JSON data to S3.
 
         Args:
             key: S3 object key
-            data: Dictionary to upload (datetime values are converted to ISO 8601)
+            data: Dictionary to upload (datetime values are converted to ISO 8601;
+                naive datetimes are treated as UTC; UTC is written as "Z")
+            if_match: Only overwrite the object if its ETag still equals this value
+
+        Returns:
+            ETag of the written object
 
         Raises:
             RuntimeError: If S3 client is not initialized
+            PreconditionFailedError: If if_match is given and the object has changed
             ClientError: If S3 upload fails
+            TypeError: If data contains values that cannot be serialized
         """
-        # Convert datetime to ISO 8601 format
-        json_str = json.dumps(data, default=self._json_serializer, ensure_ascii=False, indent=2)
-        json_bytes = json_str.encode("utf-8")
+        # orjson serializes datetimes natively and encodes straight to UTF-8 bytes.
+        # Output is compact: these documents are read by machines, not people.
+        json_bytes = orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
 
-        await self.upload_file(json_bytes, key, content_type="application/json")
-        logger.debug("JSON uploaded to S3", bucket=self.bucket_name, key=key)
+        etag = await self._put_object(
+            json_bytes, key, content_type="application/json", if_match=if_match
+        )
+        self._logger.debug("JSON uploaded to S3", key=key)
+        return etag
 
     async def download_json(self, key: str) -> dict[str, Any]:
         """
@@ -198,17 +506,40 @@ class S3Storage:
             ValueError: If JSON parsing fails
             ClientError: If S3 download fails
         """
-        data = await self.download_file(key)
+        json_data, _ = await self.download_json_with_etag(key)
+        return json_data
+
+    async def download_json_with_etag(self, key: str) -> tuple[dict[str, Any], str]:
+        """
+        Download JSON data from S3 together with the object's ETag.
+
+        The ETag can be passed to upload_json(if_match=...) to make a
+        read-modify-write cycle fail instead of overwriting a concurrent update.
+
+        Args:
+            key: S3 object key
+
+        Returns:
+            Tuple of (parsed dictionary, ETag)
+
+        Raises:
+            RuntimeError: If S3 client is not initialized
+            FileNotFoundError: If object does not exist
+            ValueError: If JSON parsing fails
+            ClientError: If S3 download fails
+        """
+        response = await self._get_object(key)
+        async with response["Body"] as body:
+            data: bytes = await body.read()
 
         try:
-            json_data: dict[str, Any] = json.loads(data.decode("utf-8"))
-            logger.debug("JSON downloaded from S3", bucket=self.bucket_name, key=key)
-            return json_data
+            json_data: dict[str, Any] = orjson.loads(data)
+            self._logger.debug("JSON downloaded from S3", key=key)
+            return json_data, response["ETag"]
 
-        except json.JSONDecodeError as e:
-            logger.error(
+        except orjson.JSONDecodeError as e:
+            self._logger.error(
                 "Failed to parse JSON from S3",
-                bucket=self.bucket_name,
                 key=key,
                 error=str(e),
             )
@@ -238,18 +569,16 @@ class S3Storage:
                 Params={"Bucket": self.bucket_name, "Key": key},
                 ExpiresIn=expiration,
             )
-            logger.info(
+            self._logger.debug(
                 "Presigned URL generated",
-                bucket=self.bucket_name,
                 key=key,
                 expiration_seconds=expiration,
             )
             return url
 
         except ClientError as e:
-            logger.error(
+            self._logger.error(
                 "Failed to generate presigned URL",
-                bucket=self.bucket_name,
                 key=key,
                 error=str(e),
             )
@@ -266,46 +595,52 @@ class S3Storage:
 
         Raises:
             RuntimeError: If S3 client is not initialized
-            ClientError: If S3 deletion fails (excluding NoSuchKey)
+            ClientError: If S3 deletion fails
+        """
+        await self.delete_files([key])
+
+    async def delete_files(self, keys: list[str]) -> None:
+        """
+        Delete multiple files from S3 using batched DeleteObjects requests.
+
+        Keys are sent in batches of up to 1000 (the S3 limit per request).
+        Non-existent keys are treated as successfully deleted.
+
+        Args:
+            keys: S3 object keys
+
+        Raises:
+            RuntimeError: If S3 client is not initialized
+            ClientError: If S3 deletion fails for any key
         """
         if not self._client:
             raise RuntimeError("S3Storage not initialized. Use 'async with' context manager.")
 
-        try:
-            await self._client.delete_object(Bucket=self.bucket_name, Key=key)
-            logger.info("File deleted from S3", bucket=self.bucket_name, key=key)
-
-        except ClientError as e:
-            # Ignore NoSuchKey errors (idempotent operation)
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code != "NoSuchKey":
-                logger.error(
+        for start in range(0, len(keys), _DELETE_BATCH_SIZE):
+            batch = keys[start : start + _DELETE_BATCH_SIZE]
+            try:
+                response = await self._client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except ClientError as e:
+                self._logger.error(
                     "S3 deletion failed",
-                    bucket=self.bucket_name,
-                    key=key,
+                    key_count=len(batch),
                     error=str(e),
                 )
                 raise
 
-    @staticmethod
-    def _json_serializer(obj: Any) -> str:
-        """
-        JSON serializer for objects not serializable by default json module.
-
-        Args:
-            obj: Object to serialize
-
-        Returns:
-            ISO 8601 formatted string for datetime objects
+            errors = response.get("Errors", [])
+            if errors:
+                self._logger.error(
+                    "S3 deletion failed",
+                    failed_keys=[error.get("Key") for error in errors],
+                )
+                first = errors[0]
+                raise ClientError(
+                    {"Error": {"Code": first.get("Code", ""), "Message": first.get("Message", "")}},
+                    "DeleteObjects",
+                )
 
-        Raises:
-            TypeError: If object type is not supported
-        """
-        if isinstance(obj, datetime):
-            # Ensure timezone-aware datetime
-            if obj.tzinfo is None:
-                obj = obj.replace(tzinfo=UTC)
-            iso_string: str = obj.isoformat()
-            return iso_string
-
-        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+            self._logger.debug("Files deleted from S3", key_count=len(batch))
@@ -38,20 +38,41 @@ Example:
     ... )
 """
 
+import asyncio
+import contextlib
+import time
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
 import structlog
 
+from slidemaker.api.schemas.enums import TaskStatus
 from slidemaker.api.schemas.responses import (
     ErrorDetail,
     TaskResult,
     TaskStatusResponse,
 )
+from slidemaker.api.storage import PreconditionFailedError
 
 logger = structlog.get_logger(__name__)
 
+# 自プロセスが書き込んだタスクデータを再利用する期間（秒）
+_TASK_CACHE_TTL = 60.0
+
+# 他のワーカーとの書き込み競合時に読み直して再試行する最大回数
+_UPDATE_MAX_ATTEMPTS = 3
+
+# 進捗率のみの更新をまとめて書き込むまでの待ち時間（秒）
+_PROGRESS_FLUSH_DELAY = 0.5
+
+# ステータス読み取りキャッシュの最大エントリ数（超えたら全破棄）
+_STATUS_CACHE_SIZE = 4096
+
+# これ以上更新されないステータス
+_TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED})
+
 
 class TaskManager:
     """非同期タスクのライフサイクル管理クラス。
@@ -81,13 +102,22 @@ class TaskManager:
         >>> await manager.update_task_status(task_id, "processing", "Started")
     """
 
-    def __init__(self, storage: Any) -> None:
+    def __init__(
+        self,
+        storage: Any,
+        caching_ttl: float = 1.0,
+        caching_stale_while_revalidate_ttl: float = 5.0,
+    ) -> None:
         """TaskManagerを初期化します。
 
         Args:
             storage: S3Storage インスタンス。以下のインターフェースを持つ必要があります:
-                - async def upload_json(self, key: str, data: dict) -> None
+                - async def upload_json(self, key: str, data: dict, if_match: str | None) -> str
                 - async def download_json(self, key: str) -> dict
+                - async def download_json_with_etag(self, key: str) -> tuple[dict, str]
+            caching_ttl: get_task_statusの結果をS3を読まずに返す期間（秒）
+            caching_stale_while_revalidate_ttl: caching_ttl経過後、古い結果を返しつつ
+                バックグラウンドで再取得する追加の期間（秒）
 
         Example:
             >>> from slidemaker.api.storage import S3Storage
@@ -96,6 +126,20 @@ class TaskManager:
         """
         self.storage = storage
         self._logger = logger.bind(component="TaskManager")
+        # task_id -> (書き込み時刻, 最後に書き込んだタスクデータ, ETag)
+        self._cache: dict[str, tuple[float, dict[str, Any], str]] = {}
+        # 書き込み待ちの進捗更新 task_id -> (status, message, progress)
+        self._pending_progress: dict[str, tuple[str, str, float]] = {}
+        # 進捗更新をまとめて書き込むバックグラウンドタスク
+        self._pending: dict[str, asyncio.Task[None]] = {}
+        # S3へ書き込み中の進捗更新タスクのtask_id（待機中のものは含まない）
+        self._flushing: set[str] = set()
+        self.caching_ttl = caching_ttl
+        self.caching_stale_while_revalidate_ttl = caching_stale_while_revalidate_ttl
+        # task_id -> (取得時刻, 取得したステータス)
+        self._status_cache: dict[str, tuple[float, TaskStatusResponse]] = {}
+        # 実行中のステータス再取得タスク
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
 
     def _get_task_key(self, task_id: str) -> str:
         """タスクIDからS3キーを生成します。
@@ -112,43 +156,124 @@ class TaskManager:
         """
         return f"tasks/{task_id}/status.json"
 
-    def _datetime_to_iso(self, dt: datetime) -> str:
-        """datetimeをISO 8601形式の文字列に変換します。
+    async def _load_task(self, task_id: str) -> tuple[dict[str, Any], str]:
+        """更新用にタスクデータとETagを取得します。
+
+        自プロセスが直近（_TASK_CACHE_TTL秒以内）に書き込んだデータがあれば
+        S3からのダウンロードを省略し、そのコピーを返します。
 
         Args:
-            dt: 変換対象のdatetime（タイムゾーン付き推奨）
+            task_id: タスク識別子
 
         Returns:
-            ISO 8601形式の文字列（例: "2024-01-15T10:30:00Z"）
+            (タスクデータ（呼び出し側で変更してよいコピー）, ETag)
 
-        Example:
-            >>> from datetime import UTC, datetime
-            >>> dt = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
-            >>> manager._datetime_to_iso(dt)
-            '2024-01-15T10:30:00+00:00'
+        Raises:
+            Exception: S3からの取得に失敗した場合
         """
-        return dt.isoformat()
+        cached = self._cache.get(task_id)
+        if cached is not None:
+            written_at, task_data, etag = cached
+            if time.monotonic() - written_at < _TASK_CACHE_TTL:
+                return dict(task_data), etag
+            del self._cache[task_id]
+
+        data: dict[str, Any]
+        data, etag = await self.storage.download_json_with_etag(
+            key=self._get_task_key(task_id)
+        )
+        return data, etag
+
+    async def _save_task(
+        self, task_id: str, task_data: dict[str, Any], if_match: str | None = None
+    ) -> None:
+        """タスクデータをS3に保存し、キャッシュを更新します。
 
-    def _iso_to_datetime(self, iso_str: str) -> datetime:
-        """ISO 8601形式の文字列をdatetimeに変換します。
+        完了・失敗したタスクはこれ以上更新されないためキャッシュから外します。
+        保存に失敗した場合もS3と食い違わないようキャッシュを破棄します。
 
         Args:
-            iso_str: ISO 8601形式の文字列
+            task_id: タスク識別子
+            task_data: 保存するタスクデータ
+            if_match: 指定した場合、S3上のETagが一致するときのみ上書きする
+
+        Raises:
+            PreconditionFailedError: if_matchが現在のETagと一致しない場合
+            Exception: S3への保存に失敗した場合
+        """
+        try:
+            etag = await self.storage.upload_json(
+                key=self._get_task_key(task_id),
+                data=task_data,
+                if_match=if_match,
+            )
+        except Exception:
+            self._cache.pop(task_id, None)
+            raise
+
+        # 自プロセスの書き込みは次の読み取りに必ず反映させる
+        self._status_cache.pop(task_id, None)
+        if task_data["status"] in _TERMINAL_STATUSES:
+            self._cache.pop(task_id, None)
+        else:
+            self._cache[task_id] = (time.monotonic(), task_data, etag)
+
+    async def _update_task(
+        self,
+        task_id: str,
+        apply: Callable[[dict[str, Any]], None],
+        skip_terminal: bool = False,
+    ) -> bool:
+        """タスクデータを読み込み、変更を適用して条件付きで書き戻します。
+
+        読み込み時のETagをIf-Matchに指定して保存するため、他のワーカーが
+        先に更新していた場合は上書きせず、最新データを読み直して変更を
+        再適用します（最大_UPDATE_MAX_ATTEMPTS回）。
+
+        Args:
+            task_id: タスク識別子
+            apply: タスクデータをその場で変更する関数（再試行ごとに呼ばれる）
+            skip_terminal: Trueの場合、読み込んだタスクが既に完了・失敗していれば
+                書き込まずに終了する
 
         Returns:
-            タイムゾーン付きdatetime（UTC）
+            書き込んだ場合はTrue、skip_terminalにより省略した場合はFalse
 
-        Example:
-            >>> iso_str = "2024-01-15T10:30:00Z"
-            >>> dt = manager._iso_to_datetime(iso_str)
-            >>> dt.tzinfo
-            datetime.UTC
+        Raises:
+            ValueError: タスクが存在しない場合
+            PreconditionFailedError: 再試行しても競合が解消しなかった場合
+            Exception: S3への保存に失敗した場合
         """
-        # Python 3.11+ではdatetime.fromisoformat()が"Z"をサポート
-        # 互換性のため"Z"を"+00:00"に変換
-        if iso_str.endswith("Z"):
-            iso_str = iso_str[:-1] + "+00:00"
-        return datetime.fromisoformat(iso_str)
+        for attempt in range(1, _UPDATE_MAX_ATTEMPTS + 1):
+            try:
+                task_data, etag = await self._load_task(task_id)
+            except Exception as e:
+                self._logger.error(
+                    "Failed to retrieve task",
+                    task_id=task_id,
+                    error=str(e),
+                )
+                raise ValueError(f"Task not found: {task_id}") from e
+
+            if skip_terminal and task_data["status"] in _TERMINAL_STATUSES:
+                return False
+
+            apply(task_data)
+
+            try:
+                await self._save_task(task_id, task_data, if_match=etag)
+                return True
+            except PreconditionFailedError:
+                if attempt == _UPDATE_MAX_ATTEMPTS:
+                    raise
+                self._logger.warning(
+                    "Task modified concurrently, retrying",
+                    task_id=task_id,
+                    attempt=attempt,
+                )
+
+        # 最終試行での競合は上でraiseされるためここには到達しない
+        raise AssertionError("Should never reach here")  # pragma: no cover
 
     async def create_task(self) -> str:
         """新しいタスクを作成します。
@@ -171,10 +296,10 @@ class TaskManager:
 
         task_data = {
             "task_id": task_id,
-            "status": "pending",
+            "status": TaskStatus.PENDING,
             "message": "Task created",
-            "created_at": self._datetime_to_iso(now),
-            "updated_at": self._datetime_to_iso(now),
+            "created_at": now,
+            "updated_at": now,
         }
 
         self._logger.info(
@@ -183,10 +308,7 @@ class TaskManager:
         )
 
         try:
-            await self.storage.upload_json(
-                key=self._get_task_key(task_id),
-                data=task_data,
-            )
+            await self._save_task(task_id, task_data)
             self._logger.info(
                 "Task created successfully",
                 task_id=task_id,
@@ -200,10 +322,49 @@ class TaskManager:
             )
             raise
 
+    async def create_tasks(self, count: int, max_concurrent: int = 16) -> list[str]:
+        """複数のタスクをまとめて作成します。
+
+        各タスクのS3保存を並行して行うため、create_taskを順に呼ぶより
+        往復待ちの合計が短くなります。
+
+        Args:
+            count: 作成するタスク数
+            max_concurrent: 同時に実行するS3保存の最大数
+
+        Returns:
+            生成されたタスクIDのリスト（作成順）
+
+        Raises:
+            ValueError: countが負、またはmax_concurrentが1未満の場合
+            Exception: いずれかのS3保存に失敗した場合
+
+        Example:
+            >>> task_ids = await manager.create_tasks(3)
+            >>> len(task_ids)
+            3
+        """
+        if count < 0:
+            raise ValueError(f"count must not be negative, got {count}")
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def create_one() -> str:
+            async with semaphore:
+                return await self.create_task()
+
+        return list(await asyncio.gather(*(create_one() for _ in range(count))))
+
     async def get_task_status(self, task_id: str) -> TaskStatusResponse:
         """タスクステータスを取得します。
 
         S3からタスク情報を読み込み、TaskStatusResponseに変換します。
+        取得結果はstale-while-revalidate方式でキャッシュします。
+        caching_ttl秒以内はキャッシュをそのまま返し、さらに
+        caching_stale_while_revalidate_ttl秒以内は古い結果を返しつつ
+        バックグラウンドで再取得します。完了・失敗したタスクは常にキャッシュを返します。
 
         Args:
             task_id: タスク識別子
@@ -222,6 +383,44 @@ class TaskManager:
             >>> print(status.result.output_filename)
             'presentation.pptx'
         """
+        cached = self._status_cache.get(task_id)
+        if cached is not None:
+            fetched_at, response = cached
+            age = time.monotonic() - fetched_at
+            if response.status in _TERMINAL_STATUSES or age < self.caching_ttl:
+                return response
+            if age < self.caching_ttl + self.caching_stale_while_revalidate_ttl:
+                if task_id not in self._refreshing:
+                    self._refreshing[task_id] = asyncio.create_task(
+                        self._refresh_task_status(task_id)
+                    )
+                return response
+
+        return await self._fetch_task_status(task_id)
+
+    async def _refresh_task_status(self, task_id: str) -> None:
+        """バックグラウンドでステータスを再取得し、キャッシュを更新します."""
+        try:
+            await self._fetch_task_status(task_id)
+        except Exception:
+            # 失敗はログ出力済み。古い結果を返し続けないようキャッシュを捨てる
+            self._status_cache.pop(task_id, None)
+        finally:
+            self._refreshing.pop(task_id, None)
+
+    async def _fetch_task_status(self, task_id: str) -> TaskStatusResponse:
+        """S3からステータスを取得し、読み取りキャッシュに格納します.
+
+        Args:
+            task_id: タスク識別子
+
+        Returns:
+            タスクステータス情報
+
+        Raises:
+            ValueError: タスクが存在しない場合
+        """
+        fetched_at = time.monotonic()
         self._logger.debug(
             "Retrieving task status",
             task_id=task_id,
@@ -239,19 +438,26 @@ class TaskManager:
             )
             raise ValueError(f"Task not found: {task_id}") from e
 
-        # ISO文字列をdatetimeに変換
-        task_data["created_at"] = self._iso_to_datetime(task_data["created_at"])
-        task_data["updated_at"] = self._iso_to_datetime(task_data["updated_at"])
+        # ISO文字列をdatetimeに、ステータス文字列をTaskStatusに変換
+        # （datetime.fromisoformatは"Z"表記もそのまま解釈できる）
+        task_data["status"] = TaskStatus(task_data["status"])
+        task_data["created_at"] = datetime.fromisoformat(task_data["created_at"])
+        task_data["updated_at"] = datetime.fromisoformat(task_data["updated_at"])
 
+        # タスクデータは自身が書き込んだ信頼済みデータのため、バリデーションを省略する
         # resultフィールドが存在する場合はTaskResultに変換
         if "result" in task_data and task_data["result"] is not None:
-            task_data["result"] = TaskResult(**task_data["result"])
+            task_data["result"] = TaskResult.from_trusted(**task_data["result"])
 
         # errorフィールドが存在する場合はErrorDetailに変換
         if "error" in task_data and task_data["error"] is not None:
-            task_data["error"] = ErrorDetail(**task_data["error"])
+            task_data["error"] = ErrorDetail.from_trusted(**task_data["error"])
 
-        return TaskStatusResponse(**task_data)
+        response = TaskStatusResponse.from_trusted(**task_data)
+        if len(self._status_cache) >= _STATUS_CACHE_SIZE:
+            self._status_cache.clear()
+        self._status_cache[task_id] = (fetched_at, response)
+        return response
 
     async def update_task_status(
         self,
@@ -263,6 +469,9 @@ class TaskManager:
         """タスクステータスを更新します。
 
         既存のタスクデータを読み込み、ステータス、メッセージ、進捗率を更新してS3に保存します。
+        ステータスが変わらず進捗率のみが進む更新は即座には書き込まず、
+        _PROGRESS_FLUSH_DELAY秒の間にまとめて最新の値だけを書き込みます
+        （この場合、書き込みエラーは呼び出し元に伝播しません）。
 
         Args:
             task_id: タスク識別子
@@ -282,6 +491,84 @@ class TaskManager:
             ...     progress=0.5
             ... )
         """
+        if progress is not None and self._is_progress_only(task_id, status):
+            self._defer_progress(task_id, status, message, progress)
+            return
+
+        await self._cancel_pending_progress(task_id)
+        await self._write_status(task_id, status, message, progress)
+
+    def _is_progress_only(self, task_id: str, status: str) -> bool:
+        """自プロセスが最後に書き込んだステータスから変化がないかを判定します."""
+        cached = self._cache.get(task_id)
+        return cached is not None and cached[1]["status"] == status
+
+    def _defer_progress(self, task_id: str, status: str, message: str, progress: float) -> None:
+        """進捗更新を保留し、まとめて書き込むタスクを必要に応じて起動します."""
+        self._pending_progress[task_id] = (status, message, progress)
+        if task_id not in self._pending:
+            self._pending[task_id] = asyncio.create_task(self._flush_progress(task_id))
+
+    async def _flush_progress(self, task_id: str) -> None:
+        """保留中の進捗更新を一定間隔で書き込みます.
+
+        書き込み中に届いた更新も拾うため、保留がなくなるまで繰り返します。
+        """
+        try:
+            while True:
+                await asyncio.sleep(_PROGRESS_FLUSH_DELAY)
+                pending = self._pending_progress.pop(task_id, None)
+                if pending is None:
+                    return
+                status, message, progress = pending
+                self._flushing.add(task_id)
+                try:
+                    # 失敗は_write_status内でログ出力済み。進捗は後続の更新で上書きされる
+                    with contextlib.suppress(Exception):
+                        await self._write_status(task_id, status, message, progress)
+                finally:
+                    self._flushing.discard(task_id)
+                if task_id not in self._pending_progress:
+                    return
+        finally:
+            if self._pending.get(task_id) is asyncio.current_task():
+                del self._pending[task_id]
+
+    async def _cancel_pending_progress(self, task_id: str) -> None:
+        """保留中の進捗更新を破棄します.
+
+        直後の書き込みが保留分を上書きするため、書き込まずに破棄します。
+        待機中の書き込みタスクは取り消し、S3へ書き込み中であれば完了を待ちます
+        （途中で取り消すとS3に反映済みの書き込みのETagがキャッシュされず、
+        次の条件付き書き込みが競合として再試行になるため）。
+        """
+        self._pending_progress.pop(task_id, None)
+        flush = self._pending.pop(task_id, None)
+        if flush is None:
+            return
+        if task_id in self._flushing:
+            # 保留分は破棄済みのため、書き込み完了後にタスクは終了する
+            await flush
+            return
+        flush.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flush
+
+    async def _write_status(
+        self, task_id: str, status: str, message: str, progress: float | None
+    ) -> None:
+        """ステータス、メッセージ、進捗率をS3に書き込みます.
+
+        Args:
+            task_id: タスク識別子
+            status: 新しいステータス
+            message: ステータスメッセージ
+            progress: 進捗率（Noneの場合は削除）
+
+        Raises:
+            ValueError: タスクが存在しない場合
+            Exception: S3操作に失敗した場合
+        """
         self._logger.info(
             "Updating task status",
             task_id=task_id,
@@ -289,37 +576,22 @@ class TaskManager:
             progress=progress,
         )
 
-        try:
-            # 既存データを取得
-            task_data = await self.storage.download_json(
-                key=self._get_task_key(task_id)
-            )
-        except Exception as e:
-            self._logger.error(
-                "Failed to retrieve task for update",
-                task_id=task_id,
-                error=str(e),
-            )
-            raise ValueError(f"Task not found: {task_id}") from e
+        def apply(task_data: dict[str, Any]) -> None:
+            # ステータス更新
+            task_data["status"] = status
+            task_data["message"] = message
+            task_data["updated_at"] = datetime.now(UTC)
 
-        # ステータス更新
-        task_data["status"] = status
-        task_data["message"] = message
-        task_data["updated_at"] = self._datetime_to_iso(datetime.now(UTC))
-
-        # 進捗率を更新（processingステータス時のみ）
-        if progress is not None:
-            task_data["progress"] = progress
-        elif "progress" in task_data:
-            # progressがNoneの場合は削除（completedやfailedステータス）
-            del task_data["progress"]
+            # 進捗率を更新（processingステータス時のみ）
+            if progress is not None:
+                task_data["progress"] = progress
+            elif "progress" in task_data:
+                # progressがNoneの場合は削除（completedやfailedステータス）
+                del task_data["progress"]
 
         try:
-            await self.storage.upload_json(
-                key=self._get_task_key(task_id),
-                data=task_data,
-            )
-            self._logger.info(
+            await self._update_task(task_id, apply)
+            self._logger.debug(
                 "Task status updated successfully",
                 task_id=task_id,
                 status=status,
@@ -343,6 +615,7 @@ class TaskManager:
         """タスク完了時の結果を設定します。
 
         statusを"completed"に更新し、resultフィールドを追加します。
+        タスクが既に完了・失敗している場合は何もしません。
 
         Args:
             task_id: タスク識別子
@@ -371,40 +644,31 @@ class TaskManager:
             file_size=file_size,
             page_count=page_count,
         )
+        await self._cancel_pending_progress(task_id)
+
+        def apply(task_data: dict[str, Any]) -> None:
+            # 結果を設定
+            task_data["status"] = TaskStatus.COMPLETED
+            task_data["message"] = "Task completed successfully"
+            task_data["updated_at"] = datetime.now(UTC)
+            task_data["result"] = {
+                "output_url": output_url,
+                "output_filename": output_filename,
+                "file_size": file_size,
+                "page_count": page_count,
+            }
+
+            # 不要なフィールドを削除
+            task_data.pop("progress", None)
+            task_data.pop("error", None)
 
         try:
-            # 既存データを取得
-            task_data = await self.storage.download_json(
-                key=self._get_task_key(task_id)
-            )
-        except Exception as e:
-            self._logger.error(
-                "Failed to retrieve task for result",
-                task_id=task_id,
-                error=str(e),
-            )
-            raise ValueError(f"Task not found: {task_id}") from e
-
-        # 結果を設定
-        task_data["status"] = "completed"
-        task_data["message"] = "Task completed successfully"
-        task_data["updated_at"] = self._datetime_to_iso(datetime.now(UTC))
-        task_data["result"] = {
-            "output_url": output_url,
-            "output_filename": output_filename,
-            "file_size": file_size,
-            "page_count": page_count,
-        }
-
-        # 不要なフィールドを削除
-        task_data.pop("progress", None)
-        task_data.pop("error", None)
-
-        try:
-            await self.storage.upload_json(
-                key=self._get_task_key(task_id),
-                data=task_data,
-            )
+            if not await self._update_task(task_id, apply, skip_terminal=True):
+                self._logger.debug(
+                    "Task already finished, ignoring result",
+                    task_id=task_id,
+                )
+                return
             self._logger.info(
                 "Task result set successfully",
                 task_id=task_id,
@@ -427,6 +691,8 @@ class TaskManager:
         """タスク失敗時のエラーを設定します。
 
         statusを"failed"に更新し、errorフィールドを追加します。
+        エラーが複数の層から重ねて報告されても、既に完了・失敗した
+        タスクは上書きせずそのまま返ります。
 
         Standard Error Codes:
             - VALIDATION_ERROR: 入力データバリデーションエラー
@@ -459,40 +725,31 @@ class TaskManager:
             error_code=error_code,
             error_message=error_message,
         )
+        await self._cancel_pending_progress(task_id)
+
+        def apply(task_data: dict[str, Any]) -> None:
+            # エラーを設定
+            task_data["status"] = TaskStatus.FAILED
+            task_data["message"] = error_message
+            task_data["updated_at"] = datetime.now(UTC)
+            task_data["error"] = {
+                "error_code": error_code,
+                "error_message": error_message,
+            }
+            if details is not None:
+                task_data["error"]["details"] = details
+
+            # 不要なフィールドを削除
+            task_data.pop("progress", None)
+            task_data.pop("result", None)
 
         try:
-            # 既存データを取得
-            task_data = await self.storage.download_json(
-                key=self._get_task_key(task_id)
-            )
-        except Exception as e:
-            self._logger.error(
-                "Failed to retrieve task for error",
-                task_id=task_id,
-                error=str(e),
-            )
-            raise ValueError(f"Task not found: {task_id}") from e
-
-        # エラーを設定
-        task_data["status"] = "failed"
-        task_data["message"] = error_message
-        task_data["updated_at"] = self._datetime_to_iso(datetime.now(UTC))
-        task_data["error"] = {
-            "error_code": error_code,
-            "error_message": error_message,
-        }
-        if details is not None:
-            task_data["error"]["details"] = details
-
-        # 不要なフィールドを削除
-        task_data.pop("progress", None)
-        task_data.pop("result", None)
-
-        try:
-            await self.storage.upload_json(
-                key=self._get_task_key(task_id),
-                data=task_data,
-            )
+            if not await self._update_task(task_id, apply, skip_terminal=True):
+                self._logger.debug(
+                    "Task already finished, ignoring error",
+                    task_id=task_id,
+                )
+                return
             self._logger.error(
                 "Task error set successfully",
                 task_id=task_id,
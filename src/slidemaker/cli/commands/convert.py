@@ -4,6 +4,8 @@ PDF/画像ファイルからPowerPointファイルを生成します。
 """
 
 import asyncio
+import os
+import stat
 from pathlib import Path
 from typing import Any
 
@@ -23,7 +25,7 @@ from slidemaker.workflows.conversion import ConversionWorkflow
 logger = get_logger(__name__)
 
 # サポートされるファイル拡張子
-SUPPORTED_EXTENSIONS = {".pdf", ".png", ".jpg", ".jpeg", ".gif", ".bmp"}
+SUPPORTED_EXTENSIONS = frozenset({".pdf", ".png", ".jpg", ".jpeg", ".gif", ".bmp"})
 
 
 def convert(
@@ -255,17 +257,23 @@ def _validate_input_file(file_path: Path, max_size_mb: int = 50) -> None:
 
     Raises:
         FileNotFoundError: ファイルが存在しない
-        ValueError: ファイル形式が無効
+        ValueError: パスが無効、またはファイル形式が無効
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"Input file not found: {file_path}")
+    # 存在・種別・サイズの確認を1回のstatで行う
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Input file not found: {file_path}") from e
+    except OSError as e:
+        # NotADirectoryError、シンボリックリンクのループ、権限エラーなど
+        raise ValueError(f"Invalid file path: {e}") from e
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Input path is not a file: {file_path}")
 
     # ファイルサイズチェック（DoS攻撃防止）
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
-    if file_size_mb > max_size_mb:
+    if st.st_size > max_size_mb * 1024 * 1024:
+        file_size_mb = st.st_size / (1024 * 1024)
         raise ValueError(
             f"File too large: {file_size_mb:.2f}MB (max: {max_size_mb}MB)"
         )
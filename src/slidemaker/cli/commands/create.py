@@ -6,6 +6,8 @@ MarkdownファイルからPowerPointファイルを生成するコマンドを
 # ruff: noqa: B008  # Typerの関数呼び出しはデフォルト引数として正常なパターン
 
 import asyncio
+import os
+import stat
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -21,6 +23,9 @@ from slidemaker.workflows.new_slide import NewSlideWorkflow
 
 logger = structlog.get_logger(__name__)
 
+# サポートされるMarkdownファイル拡張子
+SUPPORTED_EXTENSIONS = frozenset({".md", ".markdown"})
+
 
 def create(
     input_markdown: Path = typer.Argument(
@@ -235,37 +240,32 @@ def _validate_input_file(input_markdown: Path, max_size_mb: int = 50) -> None:
         FileNotFoundError: ファイルが存在しない場合
         ValueError: ファイルが無効な場合
     """
-    # ファイルの存在確認（Typerがチェック済みだが念のため）
-    if not input_markdown.exists():
-        raise FileNotFoundError(f"Input file not found: {input_markdown}")
+    # 存在・種別・サイズを1回のstatで確認する
+    # （statはシンボリックリンクを辿るため、リンク先の実体を検証する）
+    try:
+        st = os.stat(input_markdown)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Input file not found: {input_markdown}") from e
+    except OSError as e:
+        raise ValueError(f"Invalid file path: {e}") from e
 
-    if not input_markdown.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Not a file: {input_markdown}")
 
     # ファイルサイズチェック（DoS攻撃防止）
-    file_size_mb = input_markdown.stat().st_size / (1024 * 1024)
-    if file_size_mb > max_size_mb:
+    if st.st_size > max_size_mb * 1024 * 1024:
+        file_size_mb = st.st_size / (1024 * 1024)
         raise ValueError(
             f"File too large: {file_size_mb:.2f}MB (max: {max_size_mb}MB)"
         )
 
     # 拡張子チェック
-    valid_extensions = {".md", ".markdown"}
-    if input_markdown.suffix.lower() not in valid_extensions:
+    if input_markdown.suffix.lower() not in SUPPORTED_EXTENSIONS:
         raise ValueError(
             f"Invalid file extension: {input_markdown.suffix}. "
-            f"Allowed: {', '.join(valid_extensions)}"
+            f"Allowed: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
         )
 
-    # パストラバーサル対策: 絶対パスに解決
-    try:
-        resolved_path = input_markdown.resolve(strict=True)
-        # resolved_pathが実際に存在することを確認
-        if not resolved_path.is_file():
-            raise ValueError(f"Path is not a file: {input_markdown}")
-    except (OSError, RuntimeError) as e:
-        raise ValueError(f"Invalid file path: {e}") from e
-
 
 def _generate_output_path(
     input_markdown: Path,
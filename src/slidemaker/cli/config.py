@@ -19,11 +19,13 @@ from slidemaker.utils.config_loader import (
     expand_env_vars,
     get_default_config_path,
 )
-from slidemaker.utils.file_manager import FileManager
 from slidemaker.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml-backed safe loader when available (much faster than the pure-Python parser)
+_YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoadError(Exception):
     """Configuration loading error."""
@@ -59,7 +61,6 @@ class ConfigManager:
                        Useful for production environments to catch misconfigurations.
         """
         self.strict_env = strict_env
-        self._file_manager = FileManager()
 
     def load_config(self, config_path: Path | None = None) -> dict[str, Any]:
         """
@@ -155,9 +156,8 @@ class ConfigManager:
             ConfigValidationError: If configuration validation fails
         """
         try:
-            with config_path.open("r", encoding="utf-8") as f:
-                raw_data: Any = yaml.safe_load(f)
-                data: dict[str, Any] | None = raw_data if isinstance(raw_data, dict) else None
+            raw_data: Any = yaml.load(config_path.read_bytes(), Loader=_YAML_LOADER)
+            data: dict[str, Any] | None = raw_data if isinstance(raw_data, dict) else None
         except yaml.YAMLError as e:
             raise ConfigLoadError(f"Invalid YAML format in {config_path}: {e}") from e
         except OSError as e:
@@ -5,6 +5,7 @@ Slidemakerのコマンドラインインターフェースのメインエント
 
 import typer
 
+from slidemaker.__version__ import __version__
 from slidemaker.cli.commands.convert import convert
 from slidemaker.cli.commands.create import create
 
@@ -31,15 +32,9 @@ def version() -> None:
         $ slidemaker version
         slidemaker version 0.3.0
     """
-    try:
-        # pyproject.tomlからバージョンを取得
-        import importlib.metadata
-
-        version_str = importlib.metadata.version("slidemaker")
-        typer.echo(f"slidemaker version {version_str}")
-    except importlib.metadata.PackageNotFoundError:
-        # 開発環境でインストールされていない場合
-        typer.echo("slidemaker version (development)")
+    # パッケージ内の__version__を使用する（ヘッダー表示と同じ値）。
+    # importlib.metadataはsys.path上のdist-infoを走査するため使わない
+    typer.echo(f"slidemaker version {__version__}")
 
 
 def main() -> None:
@@ -8,19 +8,34 @@ colorful CLI output using the Rich library. It supports:
 - Application headers with version info
 """
 
+import functools
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
+from rich.style import Style
 from rich.table import Table
-from rich.traceback import install as install_rich_traceback
 
 from slidemaker.__version__ import __version__
 
-# Install rich traceback handler for better error display
-install_rich_traceback(show_locals=True)
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+# Column style for print_table, built once instead of parsed from "cyan" per column
+_TABLE_COLUMN_STYLE = Style(color="cyan")
+
+
+@functools.cache
+def _install_rich_traceback() -> None:
+    """Install the rich traceback handler once per process.
+
+    Deferred until a formatter is created so that importing this module
+    (e.g. for ``--help``) does not replace ``sys.excepthook``.
+    """
+    from rich.traceback import install
+
+    install(show_locals=True)
 
 
 class OutputFormatter:
@@ -47,6 +62,7 @@ class OutputFormatter:
         """
         self.console = Console()
         self.verbose = verbose
+        _install_rich_traceback()
 
     def print_header(self) -> None:
         """Print application header with version information.
@@ -107,7 +123,7 @@ class OutputFormatter:
             if show_traceback and self.verbose:
                 self.console.print_exception(show_locals=True)
 
-    def create_progress(self, description: str = "Processing...") -> Progress:
+    def create_progress(self, description: str = "Processing...") -> "Progress":
         """Create and return a Rich Progress bar.
 
         Args:
@@ -123,6 +139,14 @@ class OutputFormatter:
             ...     for i in range(100):
             ...         progress.update(task, advance=1)
         """
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeRemainingColumn,
+        )
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -161,7 +185,7 @@ class OutputFormatter:
 
         # Add columns
         for header in headers:
-            table.add_column(header, style="cyan", no_wrap=False)
+            table.add_column(header, style=_TABLE_COLUMN_STYLE, no_wrap=False)
 
         # Add rows
         for row in rows:
@@ -3,7 +3,11 @@
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bound on distinct hex codes kept by Color.from_hex
+_COLOR_CACHE_MAX_SIZE = 1024
+_color_cache: dict[str, "Color"] = {}
 
 
 class SlideSize(str, Enum):
@@ -19,32 +23,52 @@ class SlideSize(str, Enum):
 class Position(BaseModel):
     """Position in slide coordinates (pixels or units)."""
 
+    model_config = ConfigDict(frozen=True)
+
     x: int = Field(..., description="X coordinate from top-left")
     y: int = Field(..., description="Y coordinate from top-left")
 
-    class Config:
-        """Pydantic config."""
-
-        frozen = True
-
 
 class Size(BaseModel):
     """Size dimensions."""
 
+    model_config = ConfigDict(frozen=True)
+
     width: int = Field(..., gt=0, description="Width in pixels or units")
     height: int = Field(..., gt=0, description="Height in pixels or units")
 
-    class Config:
-        """Pydantic config."""
-
-        frozen = True
-
 
 class Color(BaseModel):
     """RGB color representation."""
 
+    model_config = ConfigDict(frozen=True)
+
     hex_value: str = Field(..., pattern=r"^#[0-9A-Fa-f]{6}$", description="Hex color code")
 
+    @classmethod
+    def from_hex(cls, hex_value: str) -> "Color":
+        """
+        Get a color for a hex code, reusing a shared instance.
+
+        Color is frozen, so a deck that uses the same few colors across
+        many elements can share one validated instance per hex code.
+
+        Args:
+            hex_value: Hex color code (e.g. "#FF0000")
+
+        Returns:
+            Color instance
+
+        Raises:
+            ValueError: If hex_value is not a valid hex color code
+        """
+        color = _color_cache.get(hex_value)
+        if color is None:
+            color = cls(hex_value=hex_value)
+            if len(_color_cache) < _COLOR_CACHE_MAX_SIZE:
+                _color_cache[hex_value] = color
+        return color
+
     @classmethod
     def from_rgb(cls, r: int, g: int, b: int) -> "Color":
         """
@@ -65,12 +89,7 @@ class Color(BaseModel):
             raise ValueError(
                 f"RGB values must be integers in range 0-255, got: r={r}, g={g}, b={b}"
             )
-        return cls(hex_value=f"#{r:02x}{g:02x}{b:02x}")
-
-    class Config:
-        """Pydantic config."""
-
-        frozen = True
+        return cls.from_hex(f"#{r:02x}{g:02x}{b:02x}")
 
 
 class Alignment(str, Enum):
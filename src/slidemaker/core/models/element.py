@@ -12,7 +12,7 @@ class FontConfig(BaseModel):
 
     family: str = Field(default="Arial", description="Font family name")
     size: int = Field(default=18, gt=0, le=200, description="Font size in points")
-    color: Color = Field(default_factory=lambda: Color(hex_value="#000000"))
+    color: Color = Field(default_factory=lambda: Color.from_hex("#000000"))
     bold: bool = Field(default=False, description="Bold text")
     italic: bool = Field(default=False, description="Italic text")
     underline: bool = Field(default=False, description="Underline text")
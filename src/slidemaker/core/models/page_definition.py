@@ -1,17 +1,39 @@
 """Page definition models."""
 
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
 
 from slidemaker.core.models.element import ImageElement, TextElement
 
 
+def _element_tag(value: Any) -> str:
+    """Return the element_type tag, inferring it for tagless element dicts.
+
+    Both element classes default element_type, so older or hand-written JSON
+    may omit it; those dicts are routed by their required field instead.
+    """
+    if isinstance(value, dict):
+        tag = value.get("element_type")
+        if tag is not None:
+            return str(tag)
+        return "image" if "source" in value and "content" not in value else "text"
+    return str(getattr(value, "element_type", "text"))
+
+
+# Dispatch on element_type instead of trying each union member in turn
+PageElement = Annotated[
+    Annotated[TextElement, Tag("text")] | Annotated[ImageElement, Tag("image")],
+    Discriminator(_element_tag),
+]
+
+
 class PageDefinition(BaseModel):
     """Definition of a single slide page."""
 
     page_number: int = Field(..., ge=1, description="Page number (1-indexed)")
     title: str | None = Field(default=None, description="Optional page title")
-    elements: list[TextElement | ImageElement] = Field(
+    elements: list[PageElement] = Field(
         default_factory=list, description="List of elements on the page"
     )
     layout: str | None = Field(default=None, description="Optional layout template name")
@@ -1,12 +1,21 @@
 """JSON serialization for slide definitions."""
 
-import json
 from pathlib import Path
 from typing import Any
 
+import pydantic_core
+from pydantic import BaseModel
+
 from slidemaker.core.models import PageDefinition, SlideConfig
 
 
+class _Presentation(BaseModel):
+    """Envelope used to dump a whole presentation in one pydantic-core pass."""
+
+    slide_config: SlideConfig
+    pages: list[PageDefinition]
+
+
 class JSONSerializer:
     """Serializer for converting slide definitions to/from JSON."""
 
@@ -35,10 +44,7 @@ class JSONSerializer:
         cls, config: SlideConfig, pages: list[PageDefinition]
     ) -> dict[str, Any]:
         """Serialize entire presentation to dictionary."""
-        return {
-            "slide_config": cls.serialize_config(config),
-            "pages": [cls.serialize_page(page) for page in pages],
-        }
+        return _Presentation(slide_config=config, pages=pages).model_dump(mode="json")
 
     @classmethod
     def deserialize_presentation(
@@ -53,13 +59,12 @@ class JSONSerializer:
     def save_to_file(
         cls, config: SlideConfig, pages: list[PageDefinition], file_path: str | Path
     ) -> None:
-        """Save presentation to JSON file."""
-        data = cls.serialize_presentation(config, pages)
+        """Save presentation to JSON file (UTF-8, 2-space indent)."""
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        presentation = _Presentation(slide_config=config, pages=pages)
+        path.write_text(presentation.model_dump_json(indent=2), encoding="utf-8")
 
     @classmethod
     def load_from_file(cls, file_path: str | Path) -> tuple[SlideConfig, list[PageDefinition]]:
@@ -82,15 +87,16 @@ class JSONSerializer:
             raise FileNotFoundError(f"Presentation file not found: {path}")
 
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Invalid JSON format in {path}: {e.msg} at line {e.lineno}, column {e.colno}"
-            ) from e
-        except Exception as e:
+            raw = path.read_bytes()
+        except OSError as e:
             raise ValueError(f"Failed to read file {path}: {e}") from e
 
+        try:
+            data = pydantic_core.from_json(raw)
+        except ValueError as e:
+            # pydantic-core messages already include line and column
+            raise ValueError(f"Invalid JSON format in {path}: {e}") from e
+
         if not isinstance(data, dict):
             raise ValueError(f"Invalid presentation format in {path}: expected object, got {type(data).__name__}")
 
@@ -473,7 +473,7 @@ class ImageAnalyzer:
             Color: パースされた色オブジェクト
         """
         # デフォルトは黒
-        default_color = Color(hex_value="#000000")
+        default_color = Color.from_hex("#000000")
 
         if isinstance(color_data, dict):
             red = color_data.get("red", 0)
@@ -490,7 +490,7 @@ class ImageAnalyzer:
             # HEX文字列の場合（例: "#FF0000"）
             if color_data.startswith("#") and len(color_data) == 7:
                 try:
-                    return Color(hex_value=color_data)
+                    return Color.from_hex(color_data)
                 except ValueError:
                     self.logger.warning("invalid_hex_color", color=color_data)
                     return default_color
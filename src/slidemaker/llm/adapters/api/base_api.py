@@ -17,6 +17,13 @@ from slidemaker.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# httpx already pools keep-alive connections, but drops idle ones after 5s.
+# LLM calls are often further apart than that, so keep idle connections for
+# 60s. Pool sizes repeat the httpx defaults (omitting them means unlimited).
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+
 
 class APIAdapter(LLMAdapter):
     """Base class for API-based LLM adapters."""
@@ -32,7 +39,7 @@ class APIAdapter(LLMAdapter):
         """
         super().__init__(model=model, timeout=timeout)
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.client = httpx.AsyncClient(timeout=timeout, limits=_CONNECTION_LIMITS)
 
     @property
     @abstractmethod
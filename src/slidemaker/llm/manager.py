@@ -1,5 +1,6 @@
 """LLM manager for handling multiple LLM adapters."""
 
+import asyncio
 from typing import Any, cast
 
 from slidemaker.llm.base import LLMAdapter
@@ -154,6 +155,61 @@ class LLMManager:
             prompt=prompt, system_prompt=system_prompt, **kwargs
         )
 
+    async def generate_compositions(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        max_concurrent: int = 8,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Generate compositions for multiple independent prompts concurrently.
+
+        Requests are issued over the composition adapter's shared HTTP client,
+        so up to ``max_concurrent`` calls are in flight at once on pooled
+        keep-alive connections instead of paying one round trip after another.
+
+        Args:
+            prompts: Independent user prompts (e.g. one per slide)
+            system_prompt: Optional system prompt shared by all requests
+            max_concurrent: Maximum number of in-flight requests
+            **kwargs: Additional parameters passed to each request
+
+        If any request fails, the others are cancelled and its error is raised.
+
+        Returns:
+            Structured composition data, in the same order as ``prompts``
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+
+        logger.info(
+            "Generating compositions",
+            llm=self.composition_llm.__class__.__name__,
+            count=len(prompts),
+            max_concurrent=max_concurrent,
+        )
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def generate(prompt: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.composition_llm.generate_structured(
+                    prompt=prompt, system_prompt=system_prompt, **kwargs
+                )
+
+        # TaskGroup cancels the remaining requests as soon as one fails,
+        # so no further calls keep running (and billing) after an error
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(generate(prompt)) for prompt in prompts]
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from eg
+
+        return [task.result() for task in tasks]
+
     async def generate_image_description(
         self, prompt: str, system_prompt: str | None = None, **kwargs: Any
     ) -> str:
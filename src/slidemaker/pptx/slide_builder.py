@@ -86,7 +86,7 @@ class SlideBuilder:
 
         # Set background color if specified
         if page_def.background_color:
-            self._set_background_color(slide, Color(hex_value=page_def.background_color))
+            self._set_background_color(slide, Color.from_hex(page_def.background_color))
             logger.debug("Background color set", color=page_def.background_color)
 
         # Sort elements by z-index before placing them
@@ -7,6 +7,10 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, Field
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml.
+_YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class LLMConfig(BaseModel):
     """LLM configuration."""
@@ -141,8 +145,7 @@ def load_config(config_path: str | Path | None = None, strict_env: bool = False)
         raise FileNotFoundError(f"Config file not found: {path}")
 
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML format in {path}: {e}") from e
 
@@ -1,5 +1,6 @@
 """File management utilities."""
 
+import functools
 import shutil
 import tempfile
 from pathlib import Path
@@ -56,6 +57,15 @@ class FileManager:
         """Get output base directory path."""
         return self._output_base_dir
 
+    @functools.cached_property
+    def resolved_output_base_dir(self) -> Path:
+        """Get output base directory resolved to an absolute path.
+
+        The base directory is fixed at construction, so it is resolved once
+        and reused by every path validation instead of per call.
+        """
+        return self._output_base_dir.resolve()
+
     def _validate_output_path(self, output_path: str | Path) -> Path:
         """
         Validate and resolve output path to prevent path traversal attacks.
@@ -78,8 +88,7 @@ class FileManager:
         # Resolve to absolute path and check if it's within output_base_dir
         try:
             resolved_path = path.resolve()
-            resolved_base = self._output_base_dir.resolve()
-            resolved_path.relative_to(resolved_base)
+            resolved_path.relative_to(self.resolved_output_base_dir)
         except (ValueError, RuntimeError) as e:
             logger.error(
                 "Path traversal attempt detected",
@@ -221,10 +221,7 @@ class CompositionParser:
         font_data = data.get("font", {})
         color_value = font_data.get("color", "#000000")
         # Colorインスタンスを作成（文字列または既にColorインスタンスの場合）
-        if isinstance(color_value, str):
-            color = Color(hex_value=color_value)
-        else:
-            color = color_value  # すでにColorインスタンス
+        color = Color.from_hex(color_value) if isinstance(color_value, str) else color_value
 
         font = FontConfig(
             family=font_data.get("family", "Arial"),
@@ -7,6 +7,7 @@ from typing import Any
 import structlog
 from PIL import Image
 
+from slidemaker.core.models.element import ImageElement
 from slidemaker.core.models.page_definition import PageDefinition
 from slidemaker.image_processing.analyzer import ImageAnalyzer
 from slidemaker.image_processing.loader import ImageLoader
@@ -28,6 +29,9 @@ class ConversionWorkflow(WorkflowOrchestrator):
     4. PageDefinitionリストを作成
     5. PowerPointファイルを生成
 
+    ステップ2と3はページ単位でパイプライン化されており、分析が完了したページから
+    順に画像要素の切り出しを行うため、LLM呼び出しの待ち時間と画像処理が重なります。
+
     Attributes:
         llm_manager: LLMマネージャー
         file_manager: ファイルマネージャー
@@ -160,21 +164,13 @@ class ConversionWorkflow(WorkflowOrchestrator):
                 max_retries=max_retries,
             )
 
-            # Step 2: 各ページの分析（PageDefinition生成）
+            # Step 2-3: 各ページの分析（PageDefinition生成）と画像要素の抽出・保存
+            # 分析が完了したページから順に切り出しを行い、LLM待ち時間と重ねる
             pages: list[PageDefinition] = await self._run_step(
-                "analyze_images",
-                self._analyze_images,
+                "analyze_and_process_images",
+                self._analyze_and_process_images,
                 images,
                 max_concurrent,
-                max_retries=max_retries,
-            )
-
-            # Step 3: 画像要素の抽出と保存（PageDefinitionのImageElement.sourceを更新）
-            pages = await self._run_step(
-                "process_images",
-                self._process_images,
-                images,
-                pages,
                 temp_dir,
                 max_retries=max_retries,
             )
@@ -332,170 +328,170 @@ class ConversionWorkflow(WorkflowOrchestrator):
             self.logger.error("image_load_failed", error=str(e))
             raise WorkflowError(error_msg, details={"path": str(input_path)}) from e
 
-    async def _analyze_images(
+    async def _analyze_and_process_images(
         self,
         images: list[Image.Image],
         max_concurrent: int,
+        temp_dir: Path,
     ) -> list[PageDefinition]:
-        """画像の分析（Step 2）.
+        """画像の分析と画像要素の抽出をパイプライン実行（Step 2-3）.
 
-        LLMを使用して各画像のテキスト・画像要素を検出します。
-        並列処理でパフォーマンスを向上させます。
+        全ページの分析タスクを並列に起動し、完了したページから順に
+        画像要素の切り出し・保存をスレッドで実行します。
+        これにより、残りのページのLLM分析待ちと画像処理が重なります。
 
         Args:
             images: 分析する画像のリスト
-            max_concurrent: 最大並列数
+            max_concurrent: 最大並列分析数
+            temp_dir: 一時ファイルディレクトリ
 
         Returns:
-            list[PageDefinition]: ページ定義のリスト
+            list[PageDefinition]: 画像sourceが更新されたページ定義のリスト（入力順）
 
         Raises:
-            WorkflowError: 分析エラー
+            WorkflowError: 分析または画像処理エラー
         """
-        try:
-            self.logger.info(
-                "analyzing_images", image_count=len(images), max_concurrent=max_concurrent
-            )
-
-            # セマフォで並列数を制限
-            semaphore = asyncio.Semaphore(max_concurrent)
-
-            async def analyze_with_semaphore(image: Image.Image, index: int) -> PageDefinition:
-                async with semaphore:
-                    self.logger.debug("analyzing_image", index=index)
-                    result = await self.image_analyzer.analyze_slide_image(image)
-                    self.logger.debug("image_analyzed", index=index)
-                    return result
-
-            # 並列分析
-            page_definitions = await asyncio.gather(
-                *[analyze_with_semaphore(img, i) for i, img in enumerate(images)]
-            )
-
-            self.logger.info("images_analyzed", result_count=len(page_definitions))
-            return page_definitions
+        self.logger.info(
+            "analyzing_and_processing_images",
+            image_count=len(images),
+            max_concurrent=max_concurrent,
+            temp_dir=str(temp_dir),
+        )
 
+        # セマフォで並列数を制限
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def analyze_with_semaphore(
+            image: Image.Image, index: int
+        ) -> tuple[int, PageDefinition]:
+            async with semaphore:
+                self.logger.debug("analyzing_image", index=index)
+                result = await self.image_analyzer.analyze_slide_image(image)
+                self.logger.debug("image_analyzed", index=index)
+                return index, result
+
+        tasks = [
+            asyncio.create_task(analyze_with_semaphore(img, i)) for i, img in enumerate(images)
+        ]
+        results: dict[int, PageDefinition] = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, page = await next_done
+                await asyncio.to_thread(
+                    self._process_page, index, images[index], page, temp_dir
+                )
+                results[index] = page
         except Exception as e:
-            error_msg = f"Failed to analyze images: {e}"
-            self.logger.error("image_analysis_failed", error=str(e))
+            error_msg = f"Failed to analyze and process images: {e}"
+            self.logger.error("image_pipeline_failed", error=str(e))
             raise WorkflowError(error_msg, details={"image_count": len(images)}) from e
+        finally:
+            # 失敗時に残りの分析タスクを取り消す（完了済みタスクには影響しない）
+            for task in tasks:
+                task.cancel()
+            # 取り消したタスクの終了を待ち、他ページの例外も回収する
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _process_images(
+        self.logger.info("images_analyzed_and_processed", page_count=len(results))
+        return [results[i] for i in range(len(images))]
+
+    def _process_page(
         self,
-        images: list[Image.Image],
-        pages: list[PageDefinition],
+        page_idx: int,
+        image: Image.Image,
+        page: PageDefinition,
         temp_dir: Path,
-    ) -> list[PageDefinition]:
-        """画像要素の抽出と保存（Step 3）.
+    ) -> None:
+        """1ページ分の画像要素の抽出と保存.
 
-        PageDefinitionから画像要素を切り出して保存し、source pathを更新します。
+        ページ内のImageElementを元画像から切り出して保存し、sourceを更新します。
+        切り出しに失敗した要素はページから除外されます。
+        同期処理のため、パイプライン実行時は``asyncio.to_thread``経由で呼び出します。
 
         Args:
-            images: 元画像のリスト
-            pages: ページ定義のリスト
+            page_idx: ページ番号（0始まり、画像IDの生成に使用）
+            image: 元画像
+            page: ページ定義（elementsがインプレースで更新されます）
             temp_dir: 一時ファイルディレクトリ
+        """
+        for elem_idx, element in enumerate(page.elements):
+            # ImageElement型チェック
+            if not isinstance(element, ImageElement):
+                continue
+
+            # 画像要素の切り出し
+            # PageDefinitionのpositionとsizeは相対座標（%）なので、
+            # 実際のピクセル座標に変換
+            img_width, img_height = image.size
+
+            # ゼロ除算チェック
+            if img_width == 0 or img_height == 0:
+                self.logger.warning(
+                    "Invalid image size (zero dimension), skipping element",
+                    page_idx=page_idx,
+                    elem_idx=elem_idx,
+                    image_size=(img_width, img_height),
+                )
+                continue
 
-        Returns:
-            list[PageDefinition]: 画像sourceが更新されたページ定義のリスト
+            x_px = int(element.position.x * img_width / 100)
+            y_px = int(element.position.y * img_height / 100)
+            width_px = int(element.size.width * img_width / 100)
+            height_px = int(element.size.height * img_height / 100)
 
-        Raises:
-            WorkflowError: 画像処理エラー
-        """
-        try:
-            self.logger.info("processing_images", temp_dir=str(temp_dir), page_count=len(pages))
-
-            for page_idx, (image, page) in enumerate(zip(images, pages, strict=True)):
-                for elem_idx, element in enumerate(page.elements):
-                    # ImageElement型チェック
-                    from slidemaker.core.models.element import ImageElement
-
-                    if not isinstance(element, ImageElement):
-                        continue
-
-                    # 画像要素の切り出し
-                    # PageDefinitionのpositionとsizeは相対座標（%）なので、
-                    # 実際のピクセル座標に変換
-                    img_width, img_height = image.size
-
-                    # ゼロ除算チェック
-                    if img_width == 0 or img_height == 0:
-                        self.logger.warning(
-                            "Invalid image size (zero dimension), skipping element",
-                            page_idx=page_idx,
-                            elem_idx=elem_idx,
-                            image_size=(img_width, img_height),
-                        )
-                        continue
-
-                    x_px = int(element.position.x * img_width / 100)
-                    y_px = int(element.position.y * img_height / 100)
-                    width_px = int(element.size.width * img_width / 100)
-                    height_px = int(element.size.height * img_height / 100)
-
-                    # bboxの作成（x, y, width, height）
-                    bbox = (x_px, y_px, width_px, height_px)
-
-                    # 画像IDの生成
-                    image_id = f"page{page_idx}_elem{elem_idx}"
-
-                    # 画像の切り出しと保存
-                    try:
-                        # 画像の切り出し（synchronous）
-                        cropped_image = self.image_processor.crop_element(image, bbox)
-
-                        # ファイル名の生成
-                        filename = f"{image_id}.png"
-                        output_file_path = temp_dir / filename
-
-                        # 画像の保存（synchronous）
-                        saved_path = self.image_processor.save_image(
-                            cropped_image, str(output_file_path), format="PNG"
-                        )
-
-                        # ImageElement.sourceを更新
-                        element.source = str(saved_path)
-
-                        self.logger.debug(
-                            "image_element_processed",
-                            image_id=image_id,
-                            path=str(saved_path),
-                        )
-                    except Exception as elem_error:
-                        # 個別の画像要素の処理失敗は警告のみ（続行）
-                        self.logger.warning(
-                            "image_element_processing_failed",
-                            image_id=image_id,
-                            error=str(elem_error),
-                        )
-                        # sourceを空文字列に設定（後でフィルタリング）
-                        element.source = ""
-                        continue
-
-            # 不正なImageElementをフィルタリング
-            from slidemaker.core.models.element import ImageElement
-
-            for page in pages:
-                valid_elements = []
-                for element in page.elements:
-                    # ImageElementでsourceが空または存在しない場合はスキップ
-                    if isinstance(element, ImageElement) and (
-                        not element.source or not Path(element.source).exists()
-                    ):
-                        self.logger.warning(
-                            "Skipping ImageElement with invalid source",
-                            source=element.source,
-                        )
-                        continue
-                    valid_elements.append(element)
-                page.elements = valid_elements
-
-            self.logger.info("images_processed", page_count=len(pages))
-            return pages
+            # bboxの作成（x, y, width, height）
+            bbox = (x_px, y_px, width_px, height_px)
 
-        except Exception as e:
-            error_msg = f"Failed to process images: {e}"
-            self.logger.error("image_processing_failed", error=str(e))
-            raise WorkflowError(error_msg, details={"temp_dir": str(temp_dir)}) from e
+            # 画像IDの生成
+            image_id = f"page{page_idx}_elem{elem_idx}"
+
+            # 画像の切り出しと保存
+            try:
+                # 画像の切り出し（synchronous）
+                cropped_image = self.image_processor.crop_element(image, bbox)
+
+                # ファイル名の生成
+                filename = f"{image_id}.png"
+                output_file_path = temp_dir / filename
+
+                # 画像の保存（synchronous）
+                saved_path = self.image_processor.save_image(
+                    cropped_image, str(output_file_path), format="PNG"
+                )
+
+                # ImageElement.sourceを更新
+                element.source = str(saved_path)
+
+                self.logger.debug(
+                    "image_element_processed",
+                    image_id=image_id,
+                    path=str(saved_path),
+                )
+            except Exception as elem_error:
+                # 個別の画像要素の処理失敗は警告のみ（続行）
+                self.logger.warning(
+                    "image_element_processing_failed",
+                    image_id=image_id,
+                    error=str(elem_error),
+                )
+                # sourceを空文字列に設定（後でフィルタリング）
+                element.source = ""
+                continue
+
+        # 不正なImageElementをフィルタリング
+        valid_elements = []
+        for element in page.elements:
+            # ImageElementでsourceが空または存在しない場合はスキップ
+            if isinstance(element, ImageElement) and (
+                not element.source or not Path(element.source).exists()
+            ):
+                self.logger.warning(
+                    "Skipping ImageElement with invalid source",
+                    source=element.source,
+                )
+                continue
+            valid_elements.append(element)
+        page.elements = valid_elements
 
     async def _generate_powerpoint(
         self,
@@ -121,6 +121,13 @@ class TestValidateInputFile:
 
         assert "not a file" in str(exc_info.value).lower()
 
+    def test_validate_input_file_invalid_path(self, sample_pdf_file):
+        """Test validation raises ValueError when a path component is a file."""
+        with pytest.raises(ValueError) as exc_info:
+            _validate_input_file(sample_pdf_file / "nested.pdf")
+
+        assert "invalid file path" in str(exc_info.value).lower()
+
     def test_supported_extensions(self):
         """Test SUPPORTED_EXTENSIONS constant contains expected extensions."""
         assert ".pdf" in SUPPORTED_EXTENSIONS
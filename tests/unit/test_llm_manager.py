@@ -1,9 +1,11 @@
 """Unit tests for LLM Manager."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from slidemaker.llm.base import LLMError
 from slidemaker.llm.manager import LLMManager
 from slidemaker.utils.config_loader import LLMConfig
 
@@ -208,6 +210,68 @@ class TestLLMManager:
             prompt="Test prompt", system_prompt="You are a slide designer"
         )
 
+    @pytest.mark.asyncio
+    async def test_generate_compositions(self):
+        """Test generating compositions for multiple prompts."""
+        config = LLMConfig(
+            type="api", provider="claude", model="claude-3-5-sonnet-20241022", api_key="test-key"
+        )
+        manager = LLMManager(composition_config=config)
+
+        async def fake_generate(prompt, system_prompt=None):
+            return {"title": prompt}
+
+        with patch.object(
+            manager.composition_llm, "generate_structured", new_callable=AsyncMock
+        ) as mock_generate:
+            mock_generate.side_effect = fake_generate
+            result = await manager.generate_compositions(
+                ["Slide 1", "Slide 2", "Slide 3"], system_prompt="Designer", max_concurrent=2
+            )
+
+        assert result == [{"title": "Slide 1"}, {"title": "Slide 2"}, {"title": "Slide 3"}]
+        assert mock_generate.call_count == 3
+        mock_generate.assert_any_call(prompt="Slide 2", system_prompt="Designer")
+
+    @pytest.mark.asyncio
+    async def test_generate_compositions_cancels_on_failure(self):
+        """Test a failing request cancels the other in-flight requests."""
+        config = LLMConfig(
+            type="api", provider="claude", model="claude-3-5-sonnet-20241022", api_key="test-key"
+        )
+        manager = LLMManager(composition_config=config)
+        cancelled = []
+
+        async def fake_generate(prompt, system_prompt=None):
+            if prompt == "bad":
+                raise LLMError("boom")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(prompt)
+                raise
+            return {"title": prompt}
+
+        with patch.object(
+            manager.composition_llm, "generate_structured", new_callable=AsyncMock
+        ) as mock_generate:
+            mock_generate.side_effect = fake_generate
+            with pytest.raises(LLMError, match="boom"):
+                await manager.generate_compositions(["Slide 1", "bad", "Slide 3"])
+
+        assert sorted(cancelled) == ["Slide 1", "Slide 3"]
+
+    @pytest.mark.asyncio
+    async def test_generate_compositions_invalid_concurrency(self):
+        """Test generate_compositions rejects non-positive concurrency."""
+        config = LLMConfig(
+            type="api", provider="claude", model="claude-3-5-sonnet-20241022", api_key="test-key"
+        )
+        manager = LLMManager(composition_config=config)
+
+        with pytest.raises(ValueError, match="max_concurrent"):
+            await manager.generate_compositions(["Slide 1"], max_concurrent=0)
+
     @pytest.mark.asyncio
     async def test_generate_image_description(self):
         """Test generating image description."""
@@ -60,6 +60,18 @@ class TestColor:
         with pytest.raises(Exception):  # Pydantic validation error
             Color(hex_value="invalid")
 
+    def test_color_from_hex_shared_instance(self):
+        """Test that from_hex reuses one instance per hex code."""
+        color = Color.from_hex("#123456")
+        assert color.hex_value == "#123456"
+        assert Color.from_hex("#123456") is color
+        assert Color.from_rgb(0x12, 0x34, 0x56) is color
+
+    def test_color_from_hex_invalid(self):
+        """Test that from_hex validates the hex code."""
+        with pytest.raises(ValueError):
+            Color.from_hex("#12345")
+
     def test_color_immutable(self):
         """Test that Color is immutable."""
         color = Color(hex_value="#ff0000")
@@ -261,6 +273,30 @@ class TestPageDefinition:
         assert page.elements[1].z_index == 5
         assert page.elements[2].z_index == 10
 
+    def test_page_validate_tagless_elements(self):
+        """Test element dicts without element_type still validate."""
+        page = PageDefinition.model_validate(
+            {
+                "page_number": 1,
+                "elements": [
+                    {
+                        "position": {"x": 0, "y": 0},
+                        "size": {"width": 100, "height": 50},
+                        "content": "hi",
+                    },
+                    {
+                        "position": {"x": 0, "y": 0},
+                        "size": {"width": 100, "height": 50},
+                        "source": "img.png",
+                    },
+                ],
+            }
+        )
+        assert isinstance(page.elements[0], TextElement)
+        assert page.elements[0].content == "hi"
+        assert isinstance(page.elements[1], ImageElement)
+        assert page.elements[1].source == "img.png"
+
 
 class TestSlideConfig:
     """Tests for SlideConfig model."""
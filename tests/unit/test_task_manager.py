@@ -0,0 +1,165 @@
+"""Unit tests for TaskManager conditional (ETag) updates and progress flushing."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+pytest.importorskip("aiobotocore")
+pytest.importorskip("orjson")
+
+from botocore.exceptions import ClientError  # noqa: E402
+
+from slidemaker.api import tasks as tasks_module  # noqa: E402
+from slidemaker.api.storage import PreconditionFailedError, S3Storage  # noqa: E402
+from slidemaker.api.tasks import _UPDATE_MAX_ATTEMPTS, TaskManager  # noqa: E402
+
+
+class _FakeBody:
+    """Minimal stand-in for an aiobotocore streaming body."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    async def __aenter__(self) -> "_FakeBody":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def read(self) -> bytes:
+        return self._data
+
+
+class _FakeS3Client:
+    """In-memory S3 client that enforces IfMatch like S3 does."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[bytes, str]] = {}
+        self.put_if_match: list[str | None] = []
+        self.rejected = 0
+        self._version = 0
+
+    def store(self, key: str, body: bytes) -> str:
+        """Write an object directly, as another worker would."""
+        self._version += 1
+        etag = f'"etag-{self._version}"'
+        self.objects[key] = (body, etag)
+        return etag
+
+    async def put_object(self, **kwargs: Any) -> dict[str, Any]:
+        key, if_match = kwargs["Key"], kwargs.get("IfMatch")
+        self.put_if_match.append(if_match)
+        if if_match is not None and self.objects.get(key, (b"", None))[1] != if_match:
+            self.rejected += 1
+            raise ClientError(
+                {"Error": {"Code": "PreconditionFailed", "Message": "At least one of "
+                           "the pre-conditions you specified did not hold"}},
+                "PutObject",
+            )
+        return {"ETag": self.store(key, kwargs["Body"])}
+
+    async def get_object(self, **kwargs: Any) -> dict[str, Any]:
+        key = kwargs["Key"]
+        if key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey", "Message": ""}}, "GetObject")
+        body, etag = self.objects[key]
+        return {"Body": _FakeBody(body), "ETag": etag}
+
+
+@pytest.fixture
+def fake_client():
+    """Fake S3 client shared by storage and the test."""
+    return _FakeS3Client()
+
+
+@pytest.fixture
+def manager(fake_client):
+    """TaskManager backed by the fake S3 client."""
+    return TaskManager(storage=S3Storage(bucket_name="test-bucket", client=fake_client))
+
+
+class TestTaskManagerConditionalUpdate:
+    """Tests for the If-Match retry path of TaskManager._update_task."""
+
+    @pytest.mark.asyncio
+    async def test_retries_after_precondition_failed(self, manager, fake_client):
+        """Test a concurrent write is re-read and the update re-applied."""
+        task_id = await manager.create_task()
+        key = manager._get_task_key(task_id)
+        stale_etag = fake_client.objects[key][1]
+
+        # Another worker updates the task after this process cached its ETag
+        body, _ = fake_client.objects[key]
+        fake_client.store(key, body.replace(b'"message":"', b'"message":"other '))
+
+        await manager.set_task_error(task_id, "E_TEST", "boom")
+
+        # First write used the stale ETag and was rejected, the retry used the fresh one
+        assert fake_client.put_if_match[-2] == stale_etag
+        assert fake_client.put_if_match[-1] not in (None, stale_etag)
+        data, _ = await manager.storage.download_json_with_etag(key)
+        assert data["status"] == "failed"
+        assert data["error"]["error_code"] == "E_TEST"
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, manager, fake_client):
+        """Test PreconditionFailedError is raised when conflicts persist."""
+        task_id = await manager.create_task()
+        key = manager._get_task_key(task_id)
+        original_put = fake_client.put_object
+
+        async def conflicting_put(**kwargs: Any) -> dict[str, Any]:
+            # Every conditional write races with another worker
+            if kwargs.get("IfMatch") is not None:
+                fake_client.store(key, fake_client.objects[key][0])
+            return await original_put(**kwargs)
+
+        fake_client.put_object = conflicting_put
+
+        with pytest.raises(PreconditionFailedError):
+            await manager.set_task_error(task_id, "E_TEST", "boom")
+
+        conditional_puts = [m for m in fake_client.put_if_match if m is not None]
+        assert len(conditional_puts) == _UPDATE_MAX_ATTEMPTS
+
+
+class TestTaskManagerProgressFlush:
+    """Tests for deferred progress writes racing with terminal updates."""
+
+    @pytest.mark.asyncio
+    async def test_terminal_update_waits_for_inflight_flush(
+        self, manager, fake_client, monkeypatch
+    ):
+        """Test a terminal update during a progress write reuses its ETag."""
+        monkeypatch.setattr(tasks_module, "_PROGRESS_FLUSH_DELAY", 0)
+        task_id = await manager.create_task()
+        await manager.update_task_status(task_id, "processing", "Working", progress=0.1)
+
+        started = asyncio.Event()
+        release = asyncio.Event()
+        original_put = fake_client.put_object
+
+        async def slow_put(**kwargs: Any) -> dict[str, Any]:
+            # S3 has stored the object, but the response has not arrived yet
+            response = await original_put(**kwargs)
+            if not started.is_set():
+                started.set()
+                await release.wait()
+            return response
+
+        fake_client.put_object = slow_put
+
+        await manager.update_task_status(task_id, "processing", "Working", progress=0.5)
+        await started.wait()
+
+        terminal = asyncio.create_task(manager.set_task_error(task_id, "E_TEST", "boom"))
+        await asyncio.sleep(0)
+        assert not terminal.done()
+        release.set()
+        await terminal
+
+        # The flush finished and cached the new ETag, so no If-Match retry was needed
+        assert fake_client.rejected == 0
+        data, _ = await manager.storage.download_json_with_etag(manager._get_task_key(task_id))
+        assert data["status"] == "failed"
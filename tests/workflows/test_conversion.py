@@ -1,11 +1,12 @@
 """Tests for ConversionWorkflow."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
 from PIL import Image
 
-from slidemaker.core.models.element import ImageElement
+from slidemaker.core.models.element import ImageElement, TextElement
 from slidemaker.core.models.page_definition import PageDefinition
 from slidemaker.core.models.slide_config import SlideConfig
 from slidemaker.workflows.conversion import ConversionWorkflow
@@ -207,161 +208,194 @@ class TestConversionWorkflow:
 
         assert "failed to load" in str(exc_info.value).lower()
 
-    # Test _analyze_images
+    # Test _analyze_and_process_images
 
     @pytest.mark.asyncio
-    async def test_analyze_images_basic(self, workflow, mock_image, image_analyzer):
-        """Test _analyze_images analyzes images successfully."""
-        images = [mock_image, mock_image]
-        analysis_result = {
-            "elements": [{"type": "text", "content": "Test"}],
-            "background": {"color": "#FFFFFF"},
-        }
-        image_analyzer.analyze_slide_image.return_value = analysis_result
+    async def test_analyze_and_process_images_preserves_order(
+        self, workflow, mock_image, image_analyzer, tmp_path
+    ):
+        """Test _analyze_and_process_images returns pages in input order."""
+        import asyncio
 
-        result = await workflow._analyze_images(images, max_concurrent=3)
+        images = [mock_image] * 3
+        pages = [PageDefinition(page_number=i + 1) for i in range(3)]
+        # 後のページほど早く分析が完了するようにする
+        delays = iter([0.03, 0.02, 0.01])
+        results = iter(pages)
 
-        assert len(result) == 2
-        assert result[0] == analysis_result
-        assert image_analyzer.analyze_slide_image.call_count == 2
+        async def analyze(image):
+            page = next(results)
+            await asyncio.sleep(next(delays))
+            return page
+
+        image_analyzer.analyze_slide_image.side_effect = analyze
+
+        result = await workflow._analyze_and_process_images(
+            images, max_concurrent=3, temp_dir=tmp_path
+        )
+
+        assert [page.page_number for page in result] == [1, 2, 3]
+        assert image_analyzer.analyze_slide_image.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_analyze_images_concurrent(self, workflow, mock_image, image_analyzer):
-        """Test _analyze_images uses concurrent processing."""
-        images = [mock_image] * 5
-        analysis_result = {"elements": [], "background": {}}
-        image_analyzer.analyze_slide_image.return_value = analysis_result
+    async def test_analyze_and_process_images_extracts_elements(
+        self, workflow, mock_image, image_analyzer, image_processor, tmp_path
+    ):
+        """Test _analyze_and_process_images crops image elements of analyzed pages."""
+        saved_path = tmp_path / "page0_elem0.png"
+        saved_path.write_bytes(b"png")
+        page = PageDefinition(
+            page_number=1,
+            elements=[
+                ImageElement(
+                    position={"x": 10, "y": 10},
+                    size={"width": 50, "height": 50},
+                    source="",
+                )
+            ],
+        )
+        image_analyzer.analyze_slide_image.return_value = page
+        image_processor.crop_element.return_value = mock_image
+        image_processor.save_image.return_value = str(saved_path)
 
-        result = await workflow._analyze_images(images, max_concurrent=2)
+        result = await workflow._analyze_and_process_images(
+            [mock_image], max_concurrent=3, temp_dir=tmp_path
+        )
 
-        assert len(result) == 5
-        # すべての画像が分析される
-        assert image_analyzer.analyze_slide_image.call_count == 5
+        assert result[0].elements[0].source == str(saved_path)
+        image_processor.crop_element.assert_called_once_with(mock_image, (192, 108, 960, 540))
 
     @pytest.mark.asyncio
-    async def test_analyze_images_error(self, workflow, mock_image, image_analyzer):
-        """Test _analyze_images raises WorkflowError on failure."""
-        images = [mock_image]
+    async def test_analyze_and_process_images_error(self, workflow, mock_image, image_analyzer):
+        """Test _analyze_and_process_images raises WorkflowError on failure."""
         image_analyzer.analyze_slide_image.side_effect = Exception("Analysis failed")
 
         with pytest.raises(WorkflowError) as exc_info:
-            await workflow._analyze_images(images, max_concurrent=3)
+            await workflow._analyze_and_process_images(
+                [mock_image, mock_image], max_concurrent=3, temp_dir=Path("/tmp")
+            )
 
         assert "failed to analyze" in str(exc_info.value).lower()
 
-    # Test _process_images
-
     @pytest.mark.asyncio
-    async def test_process_images_basic(
-        self, workflow, mock_image, image_processor, tmp_path
+    async def test_analyze_and_process_images_limits_concurrency(
+        self, workflow, mock_image, image_analyzer, tmp_path
     ):
-        """Test _process_images extracts and saves image elements."""
-        images = [mock_image]
-        analyses = [
-            {
-                "elements": [
-                    {
-                        "type": "image",
-                        "position": {"x": 100, "y": 100},
-                        "size": {"width": 200, "height": 150},
-                    }
-                ]
-            }
-        ]
+        """Test _analyze_and_process_images runs at most max_concurrent analyses."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def analyze(image):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return PageDefinition(page_number=1)
+
+        image_analyzer.analyze_slide_image.side_effect = analyze
+
+        result = await workflow._analyze_and_process_images(
+            [mock_image] * 5, max_concurrent=2, temp_dir=tmp_path
+        )
+
+        assert len(result) == 5
+        assert peak == 2
+        assert image_analyzer.analyze_slide_image.call_count == 5
+
+    # Test _process_page
+
+    def test_process_page_basic(self, workflow, mock_image, image_processor, tmp_path):
+        """Test _process_page crops and saves image elements."""
         output_path = tmp_path / "page0_elem0.png"
-        # crop_element returns an Image
+        output_path.write_bytes(b"png")
+        page = PageDefinition(
+            page_number=1,
+            elements=[
+                ImageElement(
+                    position={"x": 10, "y": 10}, size={"width": 20, "height": 20}, source=""
+                )
+            ],
+        )
         image_processor.crop_element.return_value = mock_image
-        # save_image returns a string path
         image_processor.save_image.return_value = str(output_path)
 
-        result = await workflow._process_images(images, analyses, tmp_path)
+        workflow._process_page(0, mock_image, page, tmp_path)
 
-        assert len(result) == 1
-        assert "page0_elem0" in result
-        assert result["page0_elem0"] == output_path
-        image_processor.crop_element.assert_called_once()
-        image_processor.save_image.assert_called_once()
+        assert len(page.elements) == 1
+        assert page.elements[0].source == str(output_path)
+        image_processor.crop_element.assert_called_once_with(mock_image, (192, 108, 384, 216))
+        image_processor.save_image.assert_called_once_with(
+            mock_image, str(output_path), format="PNG"
+        )
 
-    @pytest.mark.asyncio
-    async def test_process_images_skip_text_elements(
+    def test_process_page_skip_text_elements(
         self, workflow, mock_image, image_processor, tmp_path
     ):
-        """Test _process_images skips text elements."""
-        images = [mock_image]
-        analyses = [
-            {
-                "elements": [
-                    {"type": "text", "content": "Test"},
-                    {
-                        "type": "image",
-                        "position": {"x": 100, "y": 100},
-                        "size": {"width": 200, "height": 150},
-                    },
-                ]
-            }
-        ]
+        """Test _process_page leaves text elements untouched."""
         output_path = tmp_path / "page0_elem1.png"
+        output_path.write_bytes(b"png")
+        text = TextElement(
+            position={"x": 0, "y": 0}, size={"width": 50, "height": 10}, content="Test"
+        )
+        page = PageDefinition(
+            page_number=1,
+            elements=[
+                text,
+                ImageElement(
+                    position={"x": 10, "y": 10}, size={"width": 20, "height": 20}, source=""
+                ),
+            ],
+        )
         image_processor.crop_element.return_value = mock_image
         image_processor.save_image.return_value = str(output_path)
 
-        result = await workflow._process_images(images, analyses, tmp_path)
+        workflow._process_page(0, mock_image, page, tmp_path)
 
         # 画像要素のみが処理される
-        assert len(result) == 1
+        assert page.elements[0] is text
+        assert page.elements[1].source == str(output_path)
         assert image_processor.crop_element.call_count == 1
         assert image_processor.save_image.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_process_images_continue_on_element_failure(
+    def test_process_page_continue_on_element_failure(
         self, workflow, mock_image, image_processor, tmp_path
     ):
-        """Test _process_images continues on individual element failure."""
-        images = [mock_image]
-        analyses = [
-            {
-                "elements": [
-                    {
-                        "type": "image",
-                        "position": {"x": 100, "y": 100},
-                        "size": {"width": 200, "height": 150},
-                    },
-                    {
-                        "type": "image",
-                        "position": {"x": 300, "y": 300},
-                        "size": {"width": 200, "height": 150},
-                    },
-                ]
-            }
-        ]
+        """Test _process_page drops a failed element and keeps processing."""
         output_path = tmp_path / "page0_elem1.png"
-
+        output_path.write_bytes(b"png")
+        page = PageDefinition(
+            page_number=1,
+            elements=[
+                ImageElement(
+                    position={"x": 10, "y": 10}, size={"width": 20, "height": 20}, source=""
+                ),
+                ImageElement(
+                    position={"x": 50, "y": 50}, size={"width": 20, "height": 20}, source=""
+                ),
+            ],
+        )
         # 1つ目は失敗、2つ目は成功
-        image_processor.crop_element.side_effect = [
-            Exception("Crop failed"),
-            mock_image,
-        ]
+        image_processor.crop_element.side_effect = [Exception("Crop failed"), mock_image]
         image_processor.save_image.return_value = str(output_path)
 
-        result = await workflow._process_images(images, analyses, tmp_path)
+        workflow._process_page(0, mock_image, page, tmp_path)
 
-        # 2つ目の要素のみが処理される
-        assert len(result) == 1
-        assert "page0_elem1" in result
+        # 失敗した1つ目の要素は除外される
+        assert len(page.elements) == 1
+        assert page.elements[0].source == str(output_path)
         assert image_processor.crop_element.call_count == 2
-        # save_imageは1回だけ呼ばれる（1つ目は失敗したため）
         assert image_processor.save_image.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_process_images_empty_elements(
-        self, workflow, mock_image, image_processor, tmp_path
-    ):
-        """Test _process_images handles empty elements."""
-        images = [mock_image]
-        analyses = [{"elements": []}]
+    def test_process_page_empty_elements(self, workflow, mock_image, image_processor, tmp_path):
+        """Test _process_page handles pages without elements."""
+        page = PageDefinition(page_number=1)
 
-        result = await workflow._process_images(images, analyses, tmp_path)
+        workflow._process_page(0, mock_image, page, tmp_path)
 
-        assert len(result) == 0
+        assert page.elements == []
         image_processor.crop_element.assert_not_called()
 
     # Test _create_slide_definitions